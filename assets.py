@@ -0,0 +1,77 @@
+# assets.py
+"""
+Assets Module
+
+This module loads the images shared by the menu and setup screens (the scrolling sea background and
+the SeaSafe logo) and the fonts used by all states. Each image is decoded and converted to the
+display format once per process and cached, and each font is opened once per (name, size), so
+switching between states reuses the same objects instead of reading the files again.
+
+If an image cannot be loaded, a plain placeholder surface is cached in its place, so the error is
+reported only once. The display mode must be set before the first image is loaded.
+"""
+
+import pygame
+from resource_path import resource_path
+
+# Loaded surfaces keyed by asset name.
+_image_cache = {}
+# Loaded fonts keyed by (name, size).
+_font_cache = {}
+
+def load_background():
+    """
+    Returns the sea background image, converted for fast blitting.
+
+    Returns:
+        pygame.Surface: The background image, or a plain blue 800x600 surface if it cannot be loaded.
+    """
+    bg_img = _image_cache.get("sea_bg")
+    if bg_img is None:
+        try:
+            bg_img = pygame.image.load(resource_path("images/sea_bg.png")).convert()
+        except Exception as e:
+            print("Error loading sea_bg:", e)
+            bg_img = pygame.Surface((800, 600))
+            bg_img.fill((0, 100, 200))
+        _image_cache["sea_bg"] = bg_img
+    return bg_img
+
+def load_logo():
+    """
+    Returns the SeaSafe logo, scaled to twice its original size.
+
+    Returns:
+        pygame.Surface: The scaled logo, or a translucent white 200x100 surface if it cannot be loaded.
+    """
+    logo_img = _image_cache.get("logo")
+    if logo_img is None:
+        try:
+            logo = pygame.image.load(resource_path("images/logo.png")).convert_alpha()
+            logo_img = pygame.transform.scale(logo, (logo.get_width() * 2, logo.get_height() * 2))
+        except Exception as e:
+            print("Error loading logo:", e)
+            logo_img = pygame.Surface((200, 100), pygame.SRCALPHA)
+            pygame.draw.rect(logo_img, (255, 255, 255, 180), logo_img.get_rect())
+        _image_cache["logo"] = logo_img
+    return logo_img
+
+def load_font(name, size):
+    """
+    Returns the system font with the given name and size, opening it on first use only.
+
+    The returned Font is shared, so callers must not change its style (bold, italic, underline).
+
+    Parameters:
+        name (str or None): The system font name, or None for pygame's default font.
+        size (int): The font size in pixels.
+
+    Returns:
+        pygame.font.Font: The font.
+    """
+    key = (name, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size)
+        _font_cache[key] = font
+    return font
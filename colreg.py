@@ -4,7 +4,8 @@ COLREG Helper Functions
 
 This module provides helper functions for the SeaSafe Simulator to calculate collision-related parameters
 and to classify ship encounters in compliance with the International Regulations for Preventing Collisions at Sea (COLREG).
-Functions include computation of the Closest Point of Approach (CPA) and Time to CPA (TCPA), calculation of relative bearings,
+Functions include computation of the Closest Point of Approach (CPA) and Time to CPA (TCPA) (for a single pair
+or vectorized over many pairs), calculation of relative bearings,
 classification of encounters (head-on, overtaking, crossing), and determining if one ship is on the starboard side of another.
 """
 
@@ -16,6 +17,9 @@ def compute_cpa_and_tcpa(shipA, shipB):
     """
     Compute the Closest Point of Approach (CPA) distance and the time to CPA (TCPA) between two ships.
 
+    This is a thin adapter over compute_cpa_from_relative for callers that hold Ship objects; the
+    velocities are built from each ship's cached heading cosine and sine, without trigonometry.
+
     Parameters:
         shipA (Ship): The first ship.
         shipB (Ship): The second ship.
@@ -26,27 +30,76 @@ def compute_cpa_and_tcpa(shipA, shipB):
             - t_cpa (float): The time until CPA (in hours). If t_cpa < 0 (i.e., the CPA is in the past),
               it is clamped to 0.0.
     """
-    pA = shipA.get_position_vector()
-    vA = shipA.get_velocity_vector()
-    pB = shipB.get_position_vector()
-    vB = shipB.get_velocity_vector()
+    return compute_cpa_from_relative(shipB.x - shipA.x, shipB.y - shipA.y,
+                                     shipB.speed * shipB._cos_h - shipA.speed * shipA._cos_h,
+                                     shipB.speed * shipB._sin_h - shipA.speed * shipA._sin_h)
+
+def compute_cpa_and_tcpa_scalar(ax, ay, ahdg, aspd, bx, by, bhdg, bspd):
+    """
+    Compute the CPA distance and TCPA between two ships given as plain floats.
+
+    Uses scalar math only: for 2D vectors this avoids the per-call overhead of building NumPy arrays.
+
+    Parameters:
+        ax, ay (float): Position of the first ship (in NM).
+        ahdg (float): Heading of the first ship (in degrees).
+        aspd (float): Speed of the first ship (in knots).
+        bx, by (float): Position of the second ship (in NM).
+        bhdg (float): Heading of the second ship (in degrees).
+        bspd (float): Speed of the second ship (in knots).
+
+    Returns:
+        tuple: (dist_cpa, t_cpa) in Nautical Miles and hours; t_cpa is clamped to 0.0.
+    """
+    a_rad = math.radians(ahdg)
+    b_rad = math.radians(bhdg)
+    return compute_cpa_from_relative(bx - ax, by - ay,
+                                     bspd * math.cos(b_rad) - aspd * math.cos(a_rad),
+                                     bspd * math.sin(b_rad) - aspd * math.sin(a_rad))
 
-    r0 = pB - pA      # Relative position vector from shipA to shipB
-    v_rel = vB - vA   # Relative velocity vector between the two ships
-    denom = np.dot(v_rel, v_rel)
+def compute_cpa_from_relative(rx, ry, vx, vy):
+    """
+    Compute the CPA distance and TCPA from the relative position and velocity of ship B w.r.t. ship A.
+
+    Parameters:
+        rx, ry (float): Relative position from ship A to ship B (in NM).
+        vx, vy (float): Relative velocity of ship B w.r.t. ship A (in NM/h).
+
+    Returns:
+        tuple: (dist_cpa, t_cpa) in Nautical Miles and hours; t_cpa is clamped to 0.0.
+    """
+    denom = vx * vx + vy * vy
 
     # If relative velocity is nearly zero, the ships are moving parallelly.
     # In this case, the CPA is simply the current distance.
-    if abs(denom) < 1e-9:
-        dist_cpa = np.linalg.norm(r0)
-        return dist_cpa, 0.0
+    if denom < 1e-9:
+        return math.hypot(rx, ry), 0.0
 
-    t_cpa = -np.dot(r0, v_rel) / denom
+    t_cpa = -(rx * vx + ry * vy) / denom
     if t_cpa < 0:
         t_cpa = 0.0
+    return math.hypot(rx + vx * t_cpa, ry + vy * t_cpa), t_cpa
+
+def compute_cpa_and_tcpa_arrays(r0, v_rel):
+    """
+    Vectorized version of compute_cpa_and_tcpa for many ship pairs at once.
+
+    Parameters:
+        r0 (numpy.ndarray): Relative position vectors, shape (..., 2), from shipA to shipB (in NM).
+        v_rel (numpy.ndarray): Relative velocity vectors, shape (..., 2), of shipB w.r.t. shipA (in NM/h).
 
-    r_cpa = r0 + v_rel * t_cpa  # Relative position at CPA
-    dist_cpa = np.linalg.norm(r_cpa)
+    Returns:
+        tuple: (dist_cpa, t_cpa)
+            - dist_cpa (numpy.ndarray): The distances at CPA (in Nautical Miles), shape (...).
+            - t_cpa (numpy.ndarray): The times until CPA (in hours), clamped to 0.0, shape (...).
+              Pairs moving parallelly (near-zero relative velocity) get t_cpa = 0.0.
+    """
+    denom = np.einsum('...k,...k->...', v_rel, v_rel)
+    t_cpa = np.zeros_like(denom)
+    np.divide(-np.einsum('...k,...k->...', r0, v_rel), denom, out=t_cpa, where=denom >= 1e-9)
+    np.maximum(t_cpa, 0.0, out=t_cpa)
+    r_cpa = r0 + v_rel * t_cpa[..., None]  # Relative positions at CPA
+    dist_cpa = np.linalg.norm(r_cpa, axis=-1)
     return dist_cpa, t_cpa
 
 def relative_bearing_degs(from_ship, to_ship):
@@ -69,11 +122,11 @@ def relative_bearing_degs(from_ship, to_ship):
     dy = to_ship.y - from_ship.y
     angle_abs = math.degrees(math.atan2(dy, dx))  # Absolute angle from from_ship to to_ship.
     rel = angle_abs - from_ship.heading         # Relative angle considering from_ship's heading.
-    # Normalize the relative angle to the interval (-180, 180].
-    while rel > 180:
-        rel -= 360
-    while rel <= -180:
-        rel += 360
+    # Normalize the relative angle to the interval (-180, 180] in constant time.
+    # math.remainder returns a value in [-180, 180]; map the -180 edge case to 180.
+    rel = math.remainder(rel, 360.0)
+    if rel == -180.0:
+        rel = 180.0
     return rel
 
 def classify_encounter(shipA, shipB):
@@ -92,8 +145,22 @@ def classify_encounter(shipA, shipB):
     Returns:
         str: The encounter type ('head-on', 'overtaking', or 'crossing').
     """
-    bearingAB = abs(relative_bearing_degs(shipA, shipB))
-    bearingBA = abs(relative_bearing_degs(shipB, shipA))
+    return classify_encounter_from_bearings(relative_bearing_degs(shipA, shipB),
+                                            relative_bearing_degs(shipB, shipA))
+
+def classify_encounter_from_bearings(bearingAB, bearingBA):
+    """
+    Classifies an encounter from the two ships' relative bearings (see classify_encounter).
+
+    Parameters:
+        bearingAB (float): Relative bearing of shipB as seen from shipA (in degrees).
+        bearingBA (float): Relative bearing of shipA as seen from shipB (in degrees).
+
+    Returns:
+        str: The encounter type ('head-on', 'overtaking', or 'crossing').
+    """
+    bearingAB = abs(bearingAB)
+    bearingBA = abs(bearingBA)
 
     # Both ships see each other nearly directly ahead.
     if bearingAB < 12.5 and bearingBA < 12.5:
@@ -120,5 +187,16 @@ def is_on_starboard_side(shipA, shipB):
     Returns:
         bool: True if shipB is on the starboard side of shipA, False otherwise.
     """
-    bearingAB = relative_bearing_degs(shipA, shipB)
-    return -112.5 < bearingAB < 0
+    return is_starboard_bearing(relative_bearing_degs(shipA, shipB))
+
+def is_starboard_bearing(bearing):
+    """
+    Determines whether a relative bearing lies on the starboard side (see is_on_starboard_side).
+
+    Parameters:
+        bearing (float): The relative bearing in degrees, in (-180, 180].
+
+    Returns:
+        bool: True if the bearing is between -112.5° and 0° (exclusive), False otherwise.
+    """
+    return -112.5 < bearing < 0
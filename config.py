@@ -4,7 +4,8 @@ Central Configuration Module
 
 This module defines global constants and layout parameters used throughout the SeaSafe Simulator.
 It includes base resolutions for various application states, layout margins, color definitions,
-default font size, and background scrolling speed.
+default font size, background scrolling speed, the ship trail length limit, display options, and
+the collision-avoidance search mode.
 """
 
 # Base resolutions for different application states (width, height)
@@ -34,3 +35,14 @@ DEFAULT_FONT_SIZE = 28
 
 # Background scrolling speed (pixels per second at base resolution)
 BG_SCROLL_SPEED = 30
+
+# Maximum number of positions kept in each ship's trail (oldest points are dropped first)
+MAX_TRAIL = 2000
+
+# Present frames through SDL's GPU renderer in sync with the display refresh (pygame.SCALED + vsync).
+# Falls back to a plain software window where the platform does not support it.
+USE_VSYNC = True
+
+# If set, the starboard heading search stops at the smallest turn whose CPA reaches this multiple of
+# the scenario's safe distance, instead of taking the turn with the largest CPA (None = largest CPA).
+SUFFICIENT_CPA_FACTOR = None
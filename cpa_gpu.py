@@ -0,0 +1,57 @@
+# cpa_gpu.py
+"""
+CPA GPU Module
+
+This module provides a GPU variant of the minimum-CPA evaluation of candidate headings, for very
+large heading searches (hundreds of ships times many candidate headings). It uses CuPy, which
+compiles the broadcast arithmetic below into fused CUDA kernels.
+
+CuPy is an optional dependency: if it is missing (or no CUDA device is usable), CUPY_AVAILABLE is
+False and the Simulator keeps using its CPU code paths. Uploading the ship state costs more than
+small searches take, so the GPU is only used when the number of CPA evaluations reaches
+GPU_MIN_EVALUATIONS.
+"""
+
+import numpy as np
+
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    cp = None
+    CUPY_AVAILABLE = False
+
+# Minimum number of CPA evaluations (candidate headings x ships) for which the GPU path is used.
+GPU_MIN_EVALUATIONS = 1 << 20
+
+
+def min_cpa_for_headings_gpu(idx, x, y, vx, vy, spd, test_headings):
+    """
+    Computes, for each test heading of ship idx, its minimum CPA distance against all other ships,
+    evaluating every (heading, ship) pair in one (H, N) grid on the GPU.
+
+    Matches cpa_kernels.min_cpa_for_headings up to floating-point rounding on the device.
+
+    Parameters:
+        idx (int): Index of the ship whose heading is varied.
+        x, y, vx, vy, spd (numpy.ndarray): Structure-of-Arrays ship state.
+        test_headings (numpy.ndarray): Candidate headings for ship idx (in degrees).
+
+    Returns:
+        numpy.ndarray: The minimum CPA (in NM) for each test heading (inf if there are no other ships).
+    """
+    rad = cp.radians(cp.asarray(test_headings, dtype=cp.float64))[:, None]
+    rx = (cp.asarray(x) - x[idx])[None, :]
+    ry = (cp.asarray(y) - y[idx])[None, :]
+    dvx = cp.asarray(vx)[None, :] - spd[idx] * cp.cos(rad)
+    dvy = cp.asarray(vy)[None, :] - spd[idx] * cp.sin(rad)
+    denom = dvx * dvx + dvy * dvy
+    # Near-zero relative velocity: CPA is the current distance (t_cpa = 0).
+    moving = denom >= 1e-9
+    t_cpa = cp.where(moving, -(rx * dvx + ry * dvy) / cp.where(moving, denom, 1.0), 0.0)
+    cp.maximum(t_cpa, 0.0, out=t_cpa)
+    cx = rx + dvx * t_cpa
+    cy = ry + dvy * t_cpa
+    dist_sq = cx * cx + cy * cy
+    dist_sq[:, idx] = cp.inf
+    return cp.asnumpy(cp.sqrt(dist_sq.min(axis=1)))
@@ -0,0 +1,262 @@
+# cpa_kernels.py
+"""
+CPA Kernels Module
+
+This module provides compiled numeric kernels for the SeaSafe Simulator's hot paths: the pairwise
+Closest Point of Approach (CPA) detection, the minimum-CPA evaluation of candidate headings, and the
+complete starboard heading searches (exhaustive and coarse-then-fine). The kernels operate on flat Structure-of-Arrays ship state
+(x, y, velocity components, speed) instead of Ship objects.
+
+The kernels are compiled with Numba when it is installed. Numba is an optional dependency: if it is
+missing, NUMBA_AVAILABLE is False and the Simulator keeps using its NumPy code paths.
+
+min_cpa_for_headings_parallel spreads the candidate headings over all CPU cores with prange. Starting
+the threads costs more than small searches take, so it is only worth using when the number of CPA
+evaluations reaches PARALLEL_MIN_EVALUATIONS.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Fallback used when Numba is not installed: returns the function unchanged.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Minimum number of CPA evaluations (candidate headings x other ships) for which the parallel
+# heading evaluation is faster than the serial kernels.
+PARALLEL_MIN_EVALUATIONS = 4096
+
+
+@njit(cache=True)
+def _pair_cpa(rx, ry, vx, vy):
+    """
+    Computes the CPA distance and time for one relative position (rx, ry) and relative
+    velocity (vx, vy), matching colreg.compute_cpa_and_tcpa.
+
+    Returns:
+        tuple: (dist_cpa, t_cpa) in NM and hours; t_cpa is clamped to 0.0.
+    """
+    denom = vx * vx + vy * vy
+    if denom < 1e-9:
+        return math.sqrt(rx * rx + ry * ry), 0.0
+    t_cpa = -(rx * vx + ry * vy) / denom
+    if t_cpa < 0:
+        t_cpa = 0.0
+    cx = rx + vx * t_cpa
+    cy = ry + vy * t_cpa
+    return math.sqrt(cx * cx + cy * cy), t_cpa
+
+
+@njit(cache=True)
+def _pair_cpa_sq(rx, ry, vx, vy):
+    """
+    Computes the squared CPA distance for one relative position (rx, ry) and relative velocity
+    (vx, vy), with the same t_cpa handling as _pair_cpa but without the square root.
+
+    Returns:
+        float: The squared CPA distance (in NM^2).
+    """
+    denom = vx * vx + vy * vy
+    if denom < 1e-9:
+        return rx * rx + ry * ry
+    t_cpa = -(rx * vx + ry * vy) / denom
+    if t_cpa < 0:
+        t_cpa = 0.0
+    cx = rx + vx * t_cpa
+    cy = ry + vy * t_cpa
+    return cx * cx + cy * cy
+
+
+@njit(cache=True)
+def _min_cpa_for_heading(idx, x, y, vx, vy, speed, test_heading, bound):
+    """
+    Computes the minimum CPA of ship idx against all other ships if it sailed at test_heading.
+
+    The scan tracks the smallest squared CPA distance and only takes a square root when it improves.
+    It stops as soon as the running minimum drops to bound or below; pass -inf to always get the
+    exact minimum.
+
+    Returns:
+        float: The minimum CPA (in NM), or inf if there are no other ships. If the scan stopped
+        early, the returned value is <= bound but not necessarily the true minimum.
+    """
+    rad = math.radians(test_heading)
+    tvx = speed * math.cos(rad)
+    tvy = speed * math.sin(rad)
+    min_sq = np.inf
+    for j in range(x.shape[0]):
+        if j == idx:
+            continue
+        dist_sq = _pair_cpa_sq(x[j] - x[idx], y[j] - y[idx], vx[j] - tvx, vy[j] - tvy)
+        if dist_sq < min_sq:
+            min_sq = dist_sq
+            if math.sqrt(min_sq) <= bound:
+                break
+    return math.sqrt(min_sq)
+
+
+@njit(cache=True)
+def cpa_pairwise(x, y, vx, vy, prune_radius, risk_distance):
+    """
+    Finds all ship pairs (i < j) whose CPA distance is below risk_distance.
+
+    Pairs whose current separation exceeds prune_radius are skipped without computing their CPA.
+
+    Parameters:
+        x, y (numpy.ndarray): Ship positions (in NM).
+        vx, vy (numpy.ndarray): Ship velocity components (in NM/h).
+        prune_radius (float): Broad-phase separation limit (in NM).
+        risk_distance (float): CPA distance below which a pair is reported (in NM).
+
+    Returns:
+        tuple: (i, j, dist_cpa, t_cpa) arrays describing the reported pairs, in row-major (i, j) order.
+    """
+    n = x.shape[0]
+    max_pairs = n * (n - 1) // 2
+    out_i = np.empty(max_pairs, np.int64)
+    out_j = np.empty(max_pairs, np.int64)
+    out_d = np.empty(max_pairs)
+    out_t = np.empty(max_pairs)
+    count = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            rx = x[j] - x[i]
+            ry = y[j] - y[i]
+            if math.sqrt(rx * rx + ry * ry) > prune_radius:
+                continue
+            dist_cpa, t_cpa = _pair_cpa(rx, ry, vx[j] - vx[i], vy[j] - vy[i])
+            if dist_cpa < risk_distance:
+                out_i[count] = i
+                out_j[count] = j
+                out_d[count] = dist_cpa
+                out_t[count] = t_cpa
+                count += 1
+    return out_i[:count], out_j[:count], out_d[:count], out_t[:count]
+
+
+@njit(cache=True)
+def min_cpa_for_headings(idx, x, y, vx, vy, spd, test_headings):
+    """
+    Computes, for each test heading of ship idx, its minimum CPA distance against all other ships.
+
+    Parameters:
+        idx (int): Index of the ship whose heading is varied.
+        x, y, vx, vy, spd (numpy.ndarray): Structure-of-Arrays ship state.
+        test_headings (numpy.ndarray): Candidate headings for ship idx (in degrees).
+
+    Returns:
+        numpy.ndarray: The minimum CPA (in NM) for each test heading (inf if there are no other ships).
+    """
+    min_cpas = np.empty(test_headings.shape[0])
+    for h in range(test_headings.shape[0]):
+        min_cpas[h] = _min_cpa_for_heading(idx, x, y, vx, vy, spd[idx], test_headings[h], -np.inf)
+    return min_cpas
+
+
+@njit(parallel=True, cache=True)
+def min_cpa_for_headings_parallel(idx, x, y, vx, vy, spd, test_headings):
+    """
+    Parallel variant of min_cpa_for_headings: the candidate headings are independent, so they are
+    evaluated concurrently with prange. Each iteration only writes its own slot of the result.
+
+    Parameters:
+        idx (int): Index of the ship whose heading is varied.
+        x, y, vx, vy, spd (numpy.ndarray): Structure-of-Arrays ship state (read-only).
+        test_headings (numpy.ndarray): Candidate headings for ship idx (in degrees).
+
+    Returns:
+        numpy.ndarray: The minimum CPA (in NM) for each test heading (inf if there are no other ships).
+    """
+    min_cpas = np.empty(test_headings.shape[0])
+    for h in prange(test_headings.shape[0]):
+        min_cpas[h] = _min_cpa_for_heading(idx, x, y, vx, vy, spd[idx], test_headings[h], -np.inf)
+    return min_cpas
+
+
+@njit(cache=True)
+def best_starboard_offset(idx, x, y, vx, vy, spd, base_heading, offsets, sufficient):
+    """
+    Runs the starboard heading search for ship idx: finds the offset whose heading
+    (base_heading - offset) gives the largest minimum CPA against all other ships.
+
+    The search is a branch-and-bound: a candidate only wins with a minimum CPA strictly above the best
+    so far, so its scan over the other ships is abandoned once it drops to the best so far. The
+    search also stops at the first non-zero offset that becomes the best with a minimum CPA of at
+    least sufficient (pass inf to always search every offset).
+
+    Parameters:
+        idx (int): Index of the ship whose heading is searched.
+        x, y, vx, vy, spd (numpy.ndarray): Structure-of-Arrays ship state.
+        base_heading (float): The ship's heading before the turn (in degrees).
+        offsets (numpy.ndarray): Candidate starboard offsets (in degrees); offsets[0] must be 0.
+        sufficient (float): Minimum CPA (in NM) at which the search stops early.
+
+    Returns:
+        tuple: (best_idx, current_cpa, best_cpa), where best_idx is the index of the first offset with
+        the largest minimum CPA and current_cpa is the minimum CPA at offset 0.
+    """
+    best_idx = 0
+    current_cpa = np.inf
+    best_cpa = -np.inf
+    for k in range(offsets.shape[0]):
+        min_cpa = _min_cpa_for_heading(idx, x, y, vx, vy, spd[idx], base_heading - offsets[k], best_cpa)
+        if k == 0:
+            current_cpa = min_cpa
+        if min_cpa > best_cpa:
+            best_cpa = min_cpa
+            best_idx = k
+            if k > 0 and best_cpa >= sufficient:
+                break
+    return best_idx, current_cpa, best_cpa
+
+
+@njit(cache=True)
+def coarse_then_fine_offset(idx, x, y, vx, vy, spd, base_heading, offsets, stride, sufficient):
+    """
+    Compiled variant of Simulator.search_coarse_then_fine: evaluates every stride-th offset, then the
+    offsets within one stride on either side of the best coarse offset, pruning each scan with the best
+    CPA so far and stopping each pass at a sufficient CPA like best_starboard_offset.
+
+    Parameters:
+        idx (int): Index of the ship whose heading is searched.
+        x, y, vx, vy, spd (numpy.ndarray): Structure-of-Arrays ship state.
+        base_heading (float): The ship's heading before the turn (in degrees).
+        offsets (numpy.ndarray): Candidate starboard offsets (in degrees); offsets[0] must be 0.
+        stride (int): Spacing of the coarse samples.
+        sufficient (float): Minimum CPA (in NM) at which each pass stops early.
+
+    Returns:
+        tuple: (best_idx, current_cpa, best_cpa), as for best_starboard_offset.
+    """
+    n_off = offsets.shape[0]
+    current_cpa = _min_cpa_for_heading(idx, x, y, vx, vy, spd[idx], base_heading, -np.inf)
+    coarse_cpa = current_cpa
+    center = 0
+    for k in range(stride, n_off, stride):
+        min_cpa = _min_cpa_for_heading(idx, x, y, vx, vy, spd[idx], base_heading - offsets[k], coarse_cpa)
+        if min_cpa > coarse_cpa:
+            coarse_cpa = min_cpa
+            center = k
+            if coarse_cpa >= sufficient:
+                break
+    best_idx = 0
+    best_cpa = -np.inf
+    for k in range(max(0, center - stride + 1), min(n_off, center + stride)):
+        min_cpa = _min_cpa_for_heading(idx, x, y, vx, vy, spd[idx], base_heading - offsets[k], best_cpa)
+        if min_cpa > best_cpa:
+            best_cpa = min_cpa
+            best_idx = k
+            if k > 0 and best_cpa >= sufficient:
+                break
+    return best_idx, current_cpa, best_cpa
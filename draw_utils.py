@@ -9,8 +9,9 @@ safety circles, coordinate axis labels, grids, stars, minimaps, and dashed lines
 
 import pygame
 import math
+import numpy as np
 
-def draw_button(screen, rect, text, font, color=(0, 0, 200)):
+def draw_button(screen, rect, text, font, color=(0, 0, 200), label=None):
     """
     Draws a rectangular button with centered text.
 
@@ -20,9 +21,12 @@ def draw_button(screen, rect, text, font, color=(0, 0, 200)):
         text (str): The text to display on the button.
         font (pygame.font.Font): The font used to render the text.
         color (tuple): The RGB color of the button (default is (0, 0, 200)).
+        label (pygame.Surface, optional): A pre-rendered text surface; when given, it is blitted
+                                          instead of rendering the text again.
     """
     pygame.draw.rect(screen, color, rect, border_radius=5)
-    label = font.render(text, True, (255, 255, 255))
+    if label is None:
+        label = font.render(text, True, (255, 255, 255))
     lx = rect.x + (rect.width - label.get_width()) // 2
     ly = rect.y + (rect.height - label.get_height()) // 2
     screen.blit(label, (lx, ly))
@@ -48,35 +52,48 @@ def draw_scrolling_bg(screen, bg_img, scroll_x, scroll_speed, dt):
     screen.blit(bg_img, (-scroll_x + w, 0))
     return scroll_x
 
-def draw_ship_trail(screen, ship, nm_to_px, map_height, offset_x=0, offset_y=0):
+def draw_ship_trail(screen, ship, nm_to_px, map_height, offset_x=0, offset_y=0, new_points=None):
     """
-    Draws the trail of a ship as a series of connected line segments.
+    Draws the trail of a ship as a single connected polyline.
+
+    When new_points is given, only the segments leading to the newest trail points are drawn, so a
+    trail can be drawn incrementally onto a persistent surface.
 
     Parameters:
         screen (pygame.Surface): The surface to draw on.
         ship (Ship): The ship whose trail is to be drawn. The ship must have a 'trail' attribute
-                     (list of (x,y) tuples).
+                     (a trail.Trail of (x,y) points).
         nm_to_px (float): Conversion factor from Nautical Miles (NM) to pixels.
         map_height (int): The height of the map in pixels.
         offset_x (int): Horizontal offset for drawing.
         offset_y (int): Vertical offset for drawing.
+        new_points (int, optional): Number of newest trail points to connect (None draws the whole trail).
     """
-    if len(ship.trail) < 2:
+    if new_points is None:
+        trail_pts = ship.trail.points()
+    else:
+        trail_pts = ship.trail.tail(new_points + 1)
+    if len(trail_pts) < 2:
         return
-    color = ship.color
-    for i in range(1, len(ship.trail)):
-        x1, y1 = ship.trail[i - 1]
-        x2, y2 = ship.trail[i]
-        sx1 = offset_x + x1 * nm_to_px
-        sy1 = offset_y + map_height - (y1 * nm_to_px)
-        sx2 = offset_x + x2 * nm_to_px
-        sy2 = offset_y + map_height - (y2 * nm_to_px)
-        pygame.draw.line(screen, color, (sx1, sy1), (sx2, sy2), 2)
+    # Transform all points to screen coordinates at once (the y axis points up on the map).
+    points = trail_pts * np.array([nm_to_px, -nm_to_px]) + np.array([offset_x, offset_y + map_height])
+    pygame.draw.lines(screen, ship.color, False, points.tolist(), 2)
+
+# Cache of rotated ship surfaces keyed by (length_px, width_px, color, heading in whole degrees).
+_rot_cache = {}
+# Pool of unrotated, color-filled ship surfaces keyed by (length_px, width_px, color).
+_base_surf_cache = {}
+# The nm_to_px factor the cached surfaces were built for; the caches are cleared when it changes.
+_rot_cache_scale = None
 
 def draw_ship_rect(screen, ship, nm_to_px, map_height, offset_x=0, offset_y=0):
     """
     Draws a ship as a rotated rectangle representing its physical dimensions.
 
+    Rotated surfaces are cached per ship size, color, and whole-degree heading, so a ship whose
+    heading changes slowly is drawn with a single blit instead of a new Surface and rotation.
+    The unrotated surface is pooled per ship size and color, so a new heading only costs a rotation.
+
     Parameters:
         screen (pygame.Surface): The target surface.
         ship (Ship): The ship object with attributes 'x', 'y', 'heading', 'length_m', 'width_m', and 'color'.
@@ -85,6 +102,12 @@ def draw_ship_rect(screen, ship, nm_to_px, map_height, offset_x=0, offset_y=0):
         offset_x (int): Horizontal offset for drawing.
         offset_y (int): Vertical offset for drawing.
     """
+    global _rot_cache_scale
+    # Drop cached surfaces when the map scale changes (e.g., window resize).
+    if nm_to_px != _rot_cache_scale:
+        _rot_cache.clear()
+        _base_surf_cache.clear()
+        _rot_cache_scale = nm_to_px
     # Convert ship dimensions from meters to Nautical Miles (1 NM ≈ 1852 m)
     length_nm = ship.length_m / 1852.0
     width_nm  = ship.width_m  / 1852.0
@@ -95,10 +118,17 @@ def draw_ship_rect(screen, ship, nm_to_px, map_height, offset_x=0, offset_y=0):
     # Ensure at least 1 pixel width/length.
     surf_l = max(1, int(length_px))
     surf_w = max(1, int(width_px))
-    ship_surf = pygame.Surface((surf_l, surf_w), pygame.SRCALPHA)
-    ship_surf.fill(ship.color)
-    # Rotate the ship's surface based on its heading.
-    rotated = pygame.transform.rotate(ship_surf, ship.heading)
+    key = (surf_l, surf_w, tuple(ship.color), int(round(ship.heading)) % 360)
+    rotated = _rot_cache.get(key)
+    if rotated is None:
+        ship_surf = _base_surf_cache.get(key[:3])
+        if ship_surf is None:
+            ship_surf = pygame.Surface((surf_l, surf_w), pygame.SRCALPHA)
+            ship_surf.fill(ship.color)
+            _base_surf_cache[key[:3]] = ship_surf
+        # Rotate the ship's surface based on its (whole-degree) heading.
+        rotated = pygame.transform.rotate(ship_surf, key[3])
+        _rot_cache[key] = rotated
     rect = rotated.get_rect()
     rect.center = (x_screen, y_screen)
     screen.blit(rotated, rect)
@@ -122,7 +152,27 @@ def draw_safety_circle(screen, ship, safe_distance_nm, nm_to_px, map_height, off
     if radius_px > 0:
         pygame.draw.circle(screen, (255, 0, 0), (center_x, center_y), radius_px, 1)
 
-def draw_y_axis_labels_in_margin(screen, margin_rect, map_size, font, tick_step=0.5):
+def render_tick_label(font, text, label_cache=None):
+    """
+    Renders an axis tick label, reusing a previously rendered surface when a cache is given.
+
+    Parameters:
+        font (pygame.font.Font): The font used for rendering the label.
+        text (str): The label text.
+        label_cache (dict, optional): Rendered label surfaces keyed by label text.
+
+    Returns:
+        pygame.Surface: The rendered label.
+    """
+    if label_cache is None:
+        return font.render(text, True, (0, 0, 0))
+    label = label_cache.get(text)
+    if label is None:
+        label = font.render(text, True, (0, 0, 0))
+        label_cache[text] = label
+    return label
+
+def draw_y_axis_labels_in_margin(screen, margin_rect, map_size, font, tick_step=0.5, label_cache=None):
     """
     Draws vertical axis labels inside a given margin rectangle.
 
@@ -132,6 +182,8 @@ def draw_y_axis_labels_in_margin(screen, margin_rect, map_size, font, tick_step=
         map_size (float): The maximum value of the axis (e.g., map size in NM).
         font (pygame.font.Font): The font used for rendering labels.
         tick_step (float): The value interval between ticks (default 0.5).
+        label_cache (dict, optional): Rendered label surfaces keyed by label text; missing labels
+                                      are rendered once and stored. Must only be reused with the same font.
     """
     bg_color = (130, 180, 255)
     pygame.draw.rect(screen, bg_color, margin_rect)
@@ -143,11 +195,11 @@ def draw_y_axis_labels_in_margin(screen, margin_rect, map_size, font, tick_step=
         tick_start = (margin_rect.right - 10, y)
         tick_end = (margin_rect.right, y)
         pygame.draw.line(screen, (0, 0, 0), tick_start, tick_end, 2)
-        label = font.render(f"{tick_value:.1f}", True, (0, 0, 0))
+        label = render_tick_label(font, f"{tick_value:.1f}", label_cache)
         label_rect = label.get_rect(midright=(margin_rect.right - 12, y))
         screen.blit(label, label_rect)
 
-def draw_x_axis_labels_in_margin(screen, margin_rect, map_size, font, tick_step=0.5):
+def draw_x_axis_labels_in_margin(screen, margin_rect, map_size, font, tick_step=0.5, label_cache=None):
     """
     Draws horizontal axis labels inside a given margin rectangle.
 
@@ -157,6 +209,8 @@ def draw_x_axis_labels_in_margin(screen, margin_rect, map_size, font, tick_step=
         map_size (float): The maximum value of the axis (e.g., map size in NM).
         font (pygame.font.Font): The font used for rendering labels.
         tick_step (float): The value interval between ticks (default 0.5).
+        label_cache (dict, optional): Rendered label surfaces keyed by label text; missing labels
+                                      are rendered once and stored. Must only be reused with the same font.
     """
     bg_color = (130, 180, 255)
     pygame.draw.rect(screen, bg_color, margin_rect)
@@ -168,7 +222,7 @@ def draw_x_axis_labels_in_margin(screen, margin_rect, map_size, font, tick_step=
         tick_start = (x, margin_rect.top)
         tick_end = (x, margin_rect.top + 10)
         pygame.draw.line(screen, (0, 0, 0), tick_start, tick_end, 2)
-        label = font.render(f"{tick_value:.1f}", True, (0, 0, 0))
+        label = render_tick_label(font, f"{tick_value:.1f}", label_cache)
         label_rect = label.get_rect(midtop=(x, margin_rect.top + 12))
         screen.blit(label, label_rect)
 
@@ -17,13 +17,103 @@ import pygame
 import sys
 from states.main_menu import MainMenuState
 from states.simulation_ui import SimulationState  # Used to check state type for FPS settings
+from config import USE_VSYNC
+
+# Maximum time (in milliseconds) to block waiting for input on a static screen.
+IDLE_WAIT_MS = 333
+
+def set_display_mode(size):
+    """
+    Creates or resizes the resizable main window.
+
+    When USE_VSYNC is enabled, the window uses pygame.SCALED with vsync=1, so frames are presented
+    through SDL's GPU renderer in sync with the display refresh. If the platform cannot create such
+    a renderer, a plain software window is used instead.
+
+    Parameters:
+        size (tuple): The window size (width, height) in pixels.
+
+    Returns:
+        pygame.Surface: The display surface.
+    """
+    if USE_VSYNC:
+        try:
+            return pygame.display.set_mode(size, pygame.RESIZABLE | pygame.SCALED, vsync=1)
+        except pygame.error:
+            pass
+    return pygame.display.set_mode(size, pygame.RESIZABLE)
+
+def wait_for_event_or_timeout(ms):
+    """
+    Blocks until an event arrives or the timeout expires, without spinning the CPU.
+
+    Uses pygame.event.wait (SDL_WaitEventTimeout) so the OS can suspend the process while
+    nothing is happening. If an event arrives, any further queued events are drained too.
+
+    Parameters:
+        ms (int): Maximum time to wait in milliseconds.
+
+    Returns:
+        list: The received events (empty if the timeout expired).
+    """
+    event = pygame.event.wait(ms)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+def window_in_background():
+    """
+    Determines whether the application window is minimized or has lost input focus.
+
+    Returns:
+        bool: True if the window is iconified or does not have keyboard focus; otherwise, False.
+    """
+    return not pygame.display.get_active() or not pygame.key.get_focused()
+
+def is_static_state(state):
+    """
+    Determines whether the given state renders a screen that only changes in response to user input.
+
+    Parameters:
+        state: The current application state.
+
+    Returns:
+        bool: True for the stats screen and for a paused or finished simulation; otherwise, False.
+    """
+    state_name = state.__class__.__name__
+    if state_name == "StatsState":
+        return True
+    if state_name == "SimulationState":
+        return state.paused or state.scenario_finished
+    return False
+
+def is_idle_state(state):
+    """
+    Determines whether the given state can block waiting for input instead of running at its
+    normal frame rate.
+
+    Menu screens only animate their scrolling background, so they are also treated as idle while
+    the window is minimized or in the background. A running simulation is never idle.
+
+    Parameters:
+        state: The current application state.
+
+    Returns:
+        bool: True for a static screen (see is_static_state) and for a menu screen while the window
+              is in the background; otherwise, False.
+    """
+    if is_static_state(state):
+        return True
+    if state.__class__.__name__ == "SimulationState":
+        return False
+    return window_in_background()
 
 def main():
     # Initialize the Pygame library.
     pygame.init()
     
     # Create a resizable window with an initial resolution of 800x600.
-    screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE)
+    screen = set_display_mode((800, 600))
     pygame.display.set_caption("SeaSafe Simulator")
     
     # Create a clock object to manage frame rate.
@@ -33,34 +123,45 @@ def main():
     current_state = MainMenuState(screen)
 
     running = True
+    needs_redraw = True  # Set after a state transition; cleared once the frame is flipped.
     while running:
-        # Use a slower tick (3 FPS) if the current state is SimulationState;
-        # otherwise, use 30 FPS for smoother UI experience.
-        if current_state.__class__.__name__ == "SimulationState":
-            dt = clock.tick(3) / 1000.0  # dt in seconds
+        if is_idle_state(current_state):
+            # Static screen: block until input arrives (or the timeout expires) instead of ticking.
+            events = wait_for_event_or_timeout(IDLE_WAIT_MS)
+            dt = clock.tick() / 1000.0
+            if not events and not needs_redraw and is_static_state(current_state):
+                # Nothing can have changed on a static screen: skip the update, redraw, and flip.
+                continue
         else:
-            dt = clock.tick(30) / 1000.0
-        
-        # Retrieve all Pygame events.
-        events = pygame.event.get()
+            # Use a slower tick (3 FPS) if the current state is SimulationState;
+            # otherwise, use 30 FPS for smoother UI experience.
+            if current_state.__class__.__name__ == "SimulationState":
+                dt = clock.tick(3) / 1000.0  # dt in seconds
+            else:
+                dt = clock.tick(30) / 1000.0
+            # Retrieve all Pygame events.
+            events = pygame.event.get()
+
         for event in events:
             # If the user closes the window, exit the loop.
             if event.type == pygame.QUIT:
                 running = False
             # Handle window resize events.
             elif event.type == pygame.VIDEORESIZE:
-                screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                screen = set_display_mode((event.w, event.h))
         
         # Delegate event handling, state updates, and rendering to the current state.
         current_state.handle_events(events)
         current_state.update(dt)
         current_state.render(screen)
         pygame.display.flip()  # Update the full display surface to the screen.
+        needs_redraw = False
 
         # Check if the current state requests a transition to another state.
         next_state = current_state.get_next_state()
         if next_state is not None:
             current_state = next_state
+            needs_redraw = True
 
     # Quit Pygame and exit the program.
     pygame.quit()
@@ -1,16 +1,19 @@
 import sys
 import os
+from functools import lru_cache
 
+# Base directory for resources, resolved once at import: sys._MEIPASS (the temporary folder of a
+# PyInstaller bundle) when running as a bundled executable, otherwise the directory where
+# resource_path.py is located (assumed to be the project root).
+BASE_PATH = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
     """
     Get the absolute path to a resource, works for both development and PyInstaller.
 
     When running as a bundled executable, sys._MEIPASS contains the path to the temporary folder.
-    Otherwise, this returns the path relative to this file's directory.
+    Otherwise, this returns the path relative to this file's directory. Results are cached per
+    relative path.
     """
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        # Use the directory where resource_path.py is located (assumed to be the project root)
-        base_path = os.path.dirname(os.path.abspath(__file__))
-    return os.path.normpath(os.path.join(base_path, relative_path))
+    return os.path.normpath(os.path.join(BASE_PATH, relative_path))
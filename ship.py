@@ -1,5 +1,4 @@
 import math
-import numpy as np
 
 class Ship:
     def __init__(self, name, x, y, heading, speed, dest_x, dest_y, length_m=100, width_m=20):
@@ -19,6 +18,8 @@ class Ship:
             The ship's heading is initialized by computing the heading towards its destination.
             The attribute `heading_adjusted` tracks how many degrees the ship has turned starboard
             during the current time step.
+            The cosine and sine of the heading are cached in `_cos_h` and `_sin_h` and refreshed
+            whenever the heading changes.
         """
         self.name = name
         self.x = x
@@ -36,6 +37,29 @@ class Ship:
         # Degrees turned starboard in the current time step.
         self.heading_adjusted = 0.0
 
+    @property
+    def heading(self):
+        """
+        The ship's heading in degrees (0 = East, 90 = North).
+        """
+        return self._heading
+
+    @heading.setter
+    def heading(self, h):
+        self.set_heading(h)
+
+    def set_heading(self, h):
+        """
+        Sets the ship's heading and caches its cosine and sine.
+
+        Parameters:
+            h (float): The new heading in degrees.
+        """
+        self._heading = h
+        rad = math.radians(h)
+        self._cos_h = math.cos(rad)
+        self._sin_h = math.sin(rad)
+
     def reset_heading_adjusted(self):
         """
         Resets the heading adjustment counter for the current time step.
@@ -52,12 +76,11 @@ class Ship:
         
         Calculation:
             distance_nm = speed (in NM/h) * dt_hours.
-            The new position is updated using the cosine and sine of the current heading (converted to radians).
+            The new position is updated using the cached cosine and sine of the current heading.
         """
         distance_nm = self.speed * dt_hours
-        rad = math.radians(self.heading)
-        self.x += distance_nm * math.cos(rad)
-        self.y += distance_nm * math.sin(rad)
+        self.x += distance_nm * self._cos_h
+        self.y += distance_nm * self._sin_h
 
     def distance_to_destination(self):
         """
@@ -86,26 +109,3 @@ class Ship:
             return self.heading  # Already at destination; retain current heading.
         angle_deg = math.degrees(math.atan2(dy, dx))
         return angle_deg
-
-    def get_position_vector(self):
-        """
-        Returns the current position of the ship as a NumPy array.
-
-        Returns:
-            numpy.ndarray: Array containing [x, y] coordinates.
-        """
-        return np.array([self.x, self.y])
-
-    def get_velocity_vector(self):
-        """
-        Computes the velocity vector of the ship based on its speed and current heading.
-        
-        Note:
-            Speed is given in knots (NM/h), so the resulting velocity vector is in NM/h.
-        
-        Returns:
-            numpy.ndarray: Array containing the velocity components [vx, vy].
-        """
-        vx = self.speed * math.cos(math.radians(self.heading))
-        vy = self.speed * math.sin(math.radians(self.heading))
-        return np.array([vx, vy])
@@ -3,11 +3,44 @@ import numpy as np
 
 from ship import Ship
 from colreg import (
-    compute_cpa_and_tcpa,
+    compute_cpa_from_relative,
+    compute_cpa_and_tcpa_arrays,
     relative_bearing_degs,
-    classify_encounter,
-    is_on_starboard_side
+    classify_encounter_from_bearings,
+    is_starboard_bearing
 )
+from cpa_kernels import (
+    NUMBA_AVAILABLE,
+    PARALLEL_MIN_EVALUATIONS,
+    best_starboard_offset,
+    coarse_then_fine_offset,
+    cpa_pairwise,
+    min_cpa_for_headings,
+    min_cpa_for_headings_parallel
+)
+from cpa_gpu import CUPY_AVAILABLE, GPU_MIN_EVALUATIONS, min_cpa_for_headings_gpu
+
+# Heading searches with at least this many candidate offsets use a coarse pass followed by a local
+# refinement (see Simulator.search_coarse_then_fine) instead of evaluating every offset.
+COARSE_SEARCH_MIN_CANDIDATES = 20
+# Stride (in candidate offsets) of the coarse pass; e.g. 5 means every 5th offset (5 deg for a 1 deg step).
+COARSE_SEARCH_STRIDE = 5
+
+# Fleets with at least this many ships find broad-phase candidate pairs by sweep-and-prune
+# (see Simulator.candidate_pairs) instead of testing all n*(n-1)/2 pairs.
+SWEEP_MIN_SHIPS = 64
+
+# Per encounter type: the phrase used in collision-avoidance messages and the Simulator counter it increments.
+ENCOUNTER_PHRASES = {
+    'head-on': "a head-on encounter",
+    'crossing': "a crossing encounter",
+    'overtaking': "an overtaking encounter"
+}
+ENCOUNTER_COUNTERS = {
+    'head-on': "count_headon",
+    'crossing': "count_crossing",
+    'overtaking': "count_overtaking"
+}
 
 # Mapping from RGB tuples to color names.
 COLOR_NAMES = {
@@ -27,30 +60,71 @@ def get_color_name(color):
 
 class Simulator:
     def __init__(self, ships, time_step, safe_distance,
-                 heading_search_range, heading_search_step):
+                 heading_search_range, heading_search_step, sufficient_cpa=None):
         """
         ships: list of Ship objects
         time_step: simulation step in seconds
         safe_distance: in NM
         heading_search_range, heading_search_step: starboard turn constraints
+        sufficient_cpa: optional CPA in NM; if set, the starboard search takes the smallest improving
+            turn that reaches it instead of the turn with the largest CPA
         """
         self.ships = ships
         self.time_step = time_step
         self.safe_distance = safe_distance
         self.heading_search_range = heading_search_range
         self.heading_search_step = heading_search_step
+        self.sufficient_cpa = sufficient_cpa
+        # Candidate starboard offsets k * step (k = 0 keeps the current heading) for the full search range.
+        # apply_multi_ship_starboard slices a prefix of this array instead of rebuilding it per call.
+        self._offsets = np.arange(self._num_offset_steps(heading_search_range) + 1) * heading_search_step
 
         self.ui_log = []
         self.collisions_avoided = []  # List of detailed collision-avoidance messages.
         self.current_time = 0.0
         self.destination_threshold = 0.1  # NM threshold to consider a ship as "arrived"
         self.no_collision_count = 0  # consecutive simulation steps without collisions
+        # Cache of pair classifications: (i, j) -> (heading_i, heading_j, (encounter, roles, bearingAB)).
+        # Cleared whenever the ships move; an entry is reused only while both headings are unchanged.
+        self._pair_cache = {}
+        # Incremented whenever a ship moves or turns, so callers can tell whether derived results are stale.
+        self.state_version = 0
+        # Last get_collisions_with_roles result, as (state_version, results).
+        self._roles_cache = None
 
         # Counters for encounter types.
         self.count_headon = 0
         self.count_crossing = 0
         self.count_overtaking = 0
 
+        # Structure-of-Arrays copy of the ship state (one slot per ship, in self.ships order),
+        # used for vectorized per-step math. Filled once by _sync_from_ships; afterwards the buffers are
+        # the authoritative ship state: the move phase updates the positions and writes them back to the
+        # Ship objects with _sync_to_ships, and heading changes go through _set_heading, which updates
+        # both the Ship and its slot.
+        n = len(ships)
+        self._x = np.empty(n)
+        self._y = np.empty(n)
+        self._hdg = np.empty(n)
+        self._spd = np.empty(n)
+        self._dx = np.empty(n)
+        self._dy = np.empty(n)
+        # Cosine and sine of each ship's heading, copied from the Ship's cached values.
+        self._cos_h = np.empty(n)
+        self._sin_h = np.empty(n)
+        # Velocity components (speed * cos/sin of heading, in NM/h); only a turned ship's slot is rewritten.
+        self._vx = np.empty(n)
+        self._vy = np.empty(n)
+        # Distance of each ship to its destination (in NM). Positions only change in the move phase of
+        # step(), so this is computed once per step there and reused by everything else.
+        self._dist_dest = np.empty(n)
+        # Display name of each ship's color, resolved once for the collision-avoidance messages.
+        self._color_names = [get_color_name(sh.color) if hasattr(sh, "color") else "Unknown" for sh in ships]
+        # Slot of each ship in the SoA buffers, keyed by object identity.
+        self._index = {id(sh): idx for idx, sh in enumerate(ships)}
+        self._sync_from_ships()
+        self._update_dist_dest()
+
     def step(self, debug=False):
         dt_hours = self.time_step / 3600.0
 
@@ -67,9 +141,7 @@ class Simulator:
 
         # 3) If collision‑free for multiple steps, revert heading.
         if self.no_collision_count > 10:
-            for sh in self.ships:
-                if sh.distance_to_destination() > self.destination_threshold:
-                    self.revert_heading_with_clamp(sh)
+            self.revert_headings_with_clamp(self._dist_dest > self.destination_threshold)
 
         # 4) Multi-iteration collision resolution.
         max_iters = 100
@@ -84,135 +156,282 @@ class Simulator:
             for dist_cpa, t_cpa, i, j in collisions:
                 if dist_cpa >= 3 * self.safe_distance:
                     continue
-                shipA = self.ships[i]
-                shipB = self.ships[j]
-                encounter = classify_encounter(shipA, shipB)
-                roles = self.assign_roles(shipA, shipB, encounter)  # (roleA, roleB)
+                encounter, roles, bearingAB = self.classify_pair(i, j)  # roles: (roleA, roleB)
                 if debug:
-                    print(f"Resolving {get_color_name(shipA.color)} vs {get_color_name(shipB.color)}, {encounter}, dist_cpa={dist_cpa:.3f}")
+                    print(f"Resolving {self._color_names[i]} vs {self._color_names[j]}, {encounter}, "
+                          f"dist_cpa={dist_cpa:.3f}")
 
                 # Process encounter types.
+                pair = (i, j)
                 if encounter == 'head-on':
-                    impA = self.apply_multi_ship_starboard(shipA, debug=debug)
-                    impB = self.apply_multi_ship_starboard(shipB, debug=debug)
-                    if impA:
-                        msg = (f"{get_color_name(shipA.color)} avoided collision in a head-on encounter with "
-                               f"{get_color_name(shipB.color)}, role: {roles[0]}, Timestep: {self.current_time}.")
-                        self.collisions_avoided.append(msg)
-                        self.count_headon += 1
-                    if impB:
-                        msg = (f"{get_color_name(shipB.color)} avoided collision in a head-on encounter with "
-                               f"{get_color_name(shipA.color)}, role: {roles[1]}, Timestep: {self.current_time}.")
-                        self.collisions_avoided.append(msg)
-                        self.count_headon += 1
+                    # Both vessels alter course to starboard.
+                    impA = self._try_avoid(pair, 0, encounter, roles, debug=debug)
+                    impB = self._try_avoid(pair, 1, encounter, roles, debug=debug)
                     if impA or impB:
                         improved_any = True
-
-                elif encounter == 'crossing':
-                    if is_on_starboard_side(shipA, shipB):
-                        impA = self.apply_multi_ship_starboard(shipA, debug=debug)
-                        if impA:
-                            msg = (f"{get_color_name(shipA.color)} avoided collision in a crossing encounter with "
-                                   f"{get_color_name(shipB.color)}, role: {roles[0]}, Timestep: {self.current_time}.")
-                            self.collisions_avoided.append(msg)
-                            self.count_crossing += 1
-                            improved_any = True
-                        else:
-                            impB = self.apply_multi_ship_starboard(shipB, stand_on=True, debug=debug)
-                            if impB:
-                                msg = (f"{get_color_name(shipB.color)} avoided collision in a crossing encounter with "
-                                       f"{get_color_name(shipA.color)}, role: {roles[1]}, Timestep: {self.current_time}.")
-                                self.collisions_avoided.append(msg)
-                                self.count_crossing += 1
-                                improved_any = True
-                    else:
-                        impB = self.apply_multi_ship_starboard(shipB, debug=debug)
-                        if impB:
-                            msg = (f"{get_color_name(shipB.color)} avoided collision in a crossing encounter with "
-                                   f"{get_color_name(shipA.color)}, role: {roles[1]}, Timestep: {self.current_time}.")
-                            self.collisions_avoided.append(msg)
-                            self.count_crossing += 1
-                            improved_any = True
-                        else:
-                            impA = self.apply_multi_ship_starboard(shipA, stand_on=True, debug=debug)
-                            if impA:
-                                msg = (f"{get_color_name(shipA.color)} avoided collision in a crossing encounter with "
-                                       f"{get_color_name(shipB.color)}, role: {roles[0]}, Timestep: {self.current_time}.")
-                                self.collisions_avoided.append(msg)
-                                self.count_crossing += 1
-                                improved_any = True
-
-                else:  # overtaking
-                    bearingAB = abs(relative_bearing_degs(shipA, shipB))
-                    if 112.5 < bearingAB < 250:
-                        impB = self.apply_multi_ship_starboard(shipB, debug=debug)
-                        if impB:
-                            msg = (f"{get_color_name(shipB.color)} avoided collision in an overtaking encounter with "
-                                   f"{get_color_name(shipA.color)}, role: {roles[1]}, Timestep: {self.current_time}.")
-                            self.collisions_avoided.append(msg)
-                            self.count_overtaking += 1
-                            improved_any = True
-                        else:
-                            impA = self.apply_multi_ship_starboard(shipA, stand_on=True, debug=debug)
-                            if impA:
-                                msg = (f"{get_color_name(shipA.color)} avoided collision in an overtaking encounter with "
-                                       f"{get_color_name(shipB.color)}, role: {roles[0]}, Timestep: {self.current_time}.")
-                                self.collisions_avoided.append(msg)
-                                self.count_overtaking += 1
-                                improved_any = True
-                    else:
-                        impA = self.apply_multi_ship_starboard(shipA, debug=debug)
-                        if impA:
-                            msg = (f"{get_color_name(shipA.color)} avoided collision in an overtaking encounter with "
-                                   f"{get_color_name(shipB.color)}, role: {roles[0]}, Timestep: {self.current_time}.")
-                            self.collisions_avoided.append(msg)
-                            self.count_overtaking += 1
-                            improved_any = True
-                        else:
-                            impB = self.apply_multi_ship_starboard(shipB, stand_on=True, debug=debug)
-                            if impB:
-                                msg = (f"{get_color_name(shipB.color)} avoided collision in an overtaking encounter with "
-                                       f"{get_color_name(shipA.color)}, role: {roles[1]}, Timestep: {self.current_time}.")
-                                self.collisions_avoided.append(msg)
-                                self.count_overtaking += 1
-                                improved_any = True
+                else:
+                    # The give-way vessel (0 = shipA, 1 = shipB) turns first; if it cannot improve the CPA,
+                    # the stand-on vessel makes a restricted turn instead.
+                    if encounter == 'crossing':
+                        give = 0 if is_starboard_bearing(bearingAB) else 1
+                    else:  # overtaking
+                        give = 1 if 112.5 < abs(bearingAB) < 250 else 0
+                    if (self._try_avoid(pair, give, encounter, roles, debug=debug)
+                            or self._try_avoid(pair, 1 - give, encounter, roles, stand_on=True, debug=debug)):
+                        improved_any = True
 
             if not improved_any:
                 if debug:
                     print(f"No improvements iteration {iteration}, stopping.")
                 break
 
-        # 5) Move ships.
-        for sh in self.ships:
-            # If the ship has arrived (distance below threshold) and arrival_time not recorded, record it.
-            if sh.distance_to_destination() < self.destination_threshold:
-                if sh.arrival_time is None:
-                    sh.arrival_time = self.current_time
-            else:
-                sh.update_position(dt_hours)
+        # 5) Move ships (vectorized over the SoA buffers).
+        arrived = self._dist_dest < self.destination_threshold
+        # If a ship has arrived and arrival_time is not recorded, record it.
+        for idx in np.flatnonzero(arrived):
+            sh = self.ships[idx]
+            if sh.arrival_time is None:
+                sh.arrival_time = self.current_time
+        # Move every ship that has not arrived along its current heading.
+        moving = ~arrived
+        distance_nm = self._spd[moving] * dt_hours
+        self._x[moving] += distance_nm * self._cos_h[moving]
+        self._y[moving] += distance_nm * self._sin_h[moving]
+        self._sync_to_ships()
+        self._update_dist_dest()
+        self._pair_cache.clear()
+        self.state_version += 1
 
         # Increment simulation time.
         self.current_time += self.time_step
         if debug:
             print(f"Completed step. time={self.current_time} s.\n")
 
+    def _try_avoid(self, pair, k, encounter, roles, stand_on=False, debug=False):
+        """
+        Lets one ship of a colliding pair attempt a starboard turn and records it if the CPA improved.
+
+        Parameters:
+            pair (tuple): (i, j) indices of the two ships.
+            k (int): Which ship of the pair turns (0 = ship i, 1 = ship j).
+            encounter (str): 'head-on', 'crossing', or 'overtaking'.
+            roles (tuple): (roleA, roleB) of the pair, see assign_roles.
+            stand_on (bool): If True, the turn is restricted (for the stand-on vessel).
+            debug (bool): If True, prints debug information.
+
+        Returns:
+            bool: True if the ship turned; otherwise, False.
+        """
+        idx, other = pair[k], pair[1 - k]
+        if not self.apply_multi_ship_starboard(self.ships[idx], stand_on=stand_on, debug=debug):
+            return False
+        self.collisions_avoided.append(
+            f"{self._color_names[idx]} avoided collision in {ENCOUNTER_PHRASES[encounter]} with "
+            f"{self._color_names[other]}, role: {roles[k]}, Timestep: {self.current_time}.")
+        counter = ENCOUNTER_COUNTERS[encounter]
+        setattr(self, counter, getattr(self, counter) + 1)
+        return True
+
+    def _sync_from_ships(self):
+        """
+        Copies the position, heading (with its cached cosine and sine), speed, and destination of
+        every ship into the SoA buffers.
+        """
+        for idx, sh in enumerate(self.ships):
+            self._x[idx] = sh.x
+            self._y[idx] = sh.y
+            self._hdg[idx] = sh.heading
+            self._cos_h[idx] = sh._cos_h
+            self._sin_h[idx] = sh._sin_h
+            self._spd[idx] = sh.speed
+            self._dx[idx] = sh.dest_x
+            self._dy[idx] = sh.dest_y
+        np.multiply(self._spd, self._cos_h, out=self._vx)
+        np.multiply(self._spd, self._sin_h, out=self._vy)
+
+    def _set_heading(self, ship, heading):
+        """
+        Sets a ship's heading and copies it, with its cached cosine and sine and the resulting velocity,
+        into the ship's SoA slot.
+
+        Parameters:
+            ship (Ship): The ship to turn.
+            heading (float): The new heading (in degrees).
+        """
+        ship.heading = heading
+        self.state_version += 1
+        idx = self._index[id(ship)]
+        self._hdg[idx] = ship.heading
+        self._cos_h[idx] = ship._cos_h
+        self._sin_h[idx] = ship._sin_h
+        self._vx[idx] = ship.speed * ship._cos_h
+        self._vy[idx] = ship.speed * ship._sin_h
+
+    def _update_dist_dest(self):
+        """
+        Recomputes every ship's distance to its destination from the SoA buffers.
+        """
+        ddx = self._dx - self._x
+        ddy = self._dy - self._y
+        self._dist_dest = np.sqrt(ddx * ddx + ddy * ddy)
+
+    def _sync_to_ships(self):
+        """
+        Writes the positions held in the SoA buffers back to the Ship objects.
+
+        Headings are not written back: the move phase does not change them, and re-assigning them
+        would needlessly recompute each ship's cached cosine and sine.
+        """
+        for sh, x, y in zip(self.ships, self._x.tolist(), self._y.tolist()):
+            sh.x = x
+            sh.y = y
+
+    def broad_phase_radius(self):
+        """
+        Computes the separation beyond which two ships cannot come within the collision-risk range
+        before every ship has reached its destination.
+
+        The look-ahead horizon is the longest remaining travel time of any ship; within it, two ships
+        can close at most at twice the maximum ship speed.
+
+        Returns:
+            float: The pruning radius (in NM).
+        """
+        moving = self._spd > 0
+        if not moving.any():
+            return 3 * self.safe_distance
+        horizon = float(np.max(self._dist_dest[moving] / self._spd[moving]))
+        max_speed = float(np.max(self._spd[moving]))
+        return 3 * self.safe_distance + 2 * max_speed * horizon
+
     def detect_collisions(self):
         """
         Detects collisions between ships based on the CPA (Closest Point of Approach).
 
+        Pairs that are further apart than broad_phase_radius() are skipped without computing their CPA.
+        When Numba is available the compiled cpa_pairwise kernel is used on the SoA buffers; otherwise,
+        for four or more ships, all pairs are evaluated at once by detect_collisions_vec, and
+        smaller fleets use the per-pair computation.
+
         Returns:
             list of tuples: Each tuple contains (dist_cpa, t_cpa, i, j) where i and j are ship indices.
         """
-        pairs = []
         n = len(self.ships)
+        prune_radius = self.broad_phase_radius()
+        if NUMBA_AVAILABLE:
+            iu, ju, dist, t_cpa = cpa_pairwise(self._x, self._y, self._vx, self._vy,
+                                               prune_radius, 3 * self.safe_distance)
+            return self._sorted_pairs(dist, t_cpa, iu, ju)
+        if n >= 4:
+            return self.detect_collisions_vec()
+        pairs = []
+        x, y, vx, vy = (a.tolist() for a in self._gather_state())
         for i in range(n):
             for j in range(i+1, n):
-                dist_cpa, t_cpa = compute_cpa_and_tcpa(self.ships[i], self.ships[j])
+                rx = x[j] - x[i]
+                ry = y[j] - y[i]
+                if math.hypot(rx, ry) > prune_radius:
+                    continue
+                dist_cpa, t_cpa = compute_cpa_from_relative(rx, ry, vx[j] - vx[i], vy[j] - vy[i])
                 if dist_cpa < 3 * self.safe_distance:
                     pairs.append((dist_cpa, t_cpa, i, j))
         pairs.sort(key=lambda x: (x[1], x[0]))
         return pairs
 
+    def _gather_state(self):
+        """
+        Returns the ship positions and velocities from the SoA buffers.
+
+        Returns:
+            tuple: (px, py, vx, vy) numpy.ndarrays of shape (n,), in NM and NM/h.
+        """
+        return self._x, self._y, self._vx, self._vy
+
+    def candidate_pairs(self, px, py, radius):
+        """
+        Finds all ship pairs (i < j) whose current separation is at most radius.
+
+        Small fleets test every pair. Fleets of SWEEP_MIN_SHIPS or more use sweep-and-prune on the
+        boxes position +/- radius: ships are sorted by x, each ship is only paired with the ships that
+        follow it within radius along x (found with a binary search), and of those only the pairs whose
+        boxes also overlap along y get the exact separation test. Far-apart pairs are never enumerated.
+
+        Parameters:
+            px, py (numpy.ndarray): Ship positions (in NM), shape (n,).
+            radius (float): The maximum separation (in NM).
+
+        Returns:
+            tuple: (iu, ju) index arrays of the pairs, in row-major (i, j) order.
+        """
+        n = len(px)
+        if n < SWEEP_MIN_SHIPS:
+            iu, ju = np.triu_indices(n, 1)
+        else:
+            order = np.argsort(px, kind='stable')
+            xs = px[order]
+            # For the k-th ship in x order, its candidates are the sorted ships k+1 .. hi[k]-1.
+            hi = np.searchsorted(xs, xs + radius, side='right')
+            counts = hi - np.arange(n) - 1
+            first = np.repeat(np.arange(n), counts)
+            # Position of each pair within its run, added to the run's start index (first + 1).
+            run_start = np.cumsum(counts) - counts
+            second = first + 1 + (np.arange(counts.sum()) - np.repeat(run_start, counts))
+            a, b = order[first], order[second]
+            overlap_y = np.abs(py[b] - py[a]) <= radius
+            a, b = a[overlap_y], b[overlap_y]
+            iu, ju = np.minimum(a, b), np.maximum(a, b)
+            rowmajor = np.lexsort((ju, iu))
+            iu, ju = iu[rowmajor], ju[rowmajor]
+        dx = px[ju] - px[iu]
+        dy = py[ju] - py[iu]
+        near = dx * dx + dy * dy <= radius * radius
+        return iu[near], ju[near]
+
+    def detect_collisions_vec(self):
+        """
+        Vectorized variant of detect_collisions. A broad phase keeps only the pairs (i < j) whose
+        current separation is within broad_phase_radius(); the CPA of all remaining pairs is then
+        computed in one pass over flat NumPy arrays.
+
+        Returns:
+            list of tuples: Each tuple contains (dist_cpa, t_cpa, i, j) where i and j are ship indices,
+            sorted by (t_cpa, dist_cpa).
+        """
+        px, py, vx, vy = self._gather_state()
+        # Broad phase: keep the pairs whose current separation is within the pruning radius.
+        iu, ju = self.candidate_pairs(px, py, self.broad_phase_radius())
+        dx = px[ju] - px[iu]
+        dy = py[ju] - py[iu]
+        # Narrow phase: CPA only for the surviving pairs.
+        dvx = vx[ju] - vx[iu]
+        dvy = vy[ju] - vy[iu]
+        vv = dvx * dvx + dvy * dvy
+        moving = vv >= 1e-9  # Near-zero relative velocity: CPA is the current distance.
+        t_cpa = np.zeros_like(vv)
+        np.divide(-(dx * dvx + dy * dvy), vv, out=t_cpa, where=moving)
+        np.maximum(t_cpa, 0.0, out=t_cpa)
+        dist = np.hypot(dx + dvx * t_cpa, dy + dvy * t_cpa)
+        risky = dist < 3 * self.safe_distance
+        return self._sorted_pairs(dist[risky], t_cpa[risky], iu[risky], ju[risky])
+
+    @staticmethod
+    def _sorted_pairs(dist, t_cpa, iu, ju):
+        """
+        Builds the collision list from parallel pair arrays, ordered by (t_cpa, dist_cpa).
+
+        The order is computed with np.lexsort, which is stable, so pairs with equal keys keep their
+        row-major (i, j) order.
+
+        Parameters:
+            dist, t_cpa (numpy.ndarray): CPA distance (in NM) and time (in hours) of each pair.
+            iu, ju (numpy.ndarray): Ship indices of each pair.
+
+        Returns:
+            list of tuples: Each tuple contains (dist_cpa, t_cpa, i, j).
+        """
+        order = np.lexsort((dist, t_cpa))
+        return list(zip(dist[order].tolist(), t_cpa[order].tolist(), iu[order].tolist(), ju[order].tolist()))
+
     def apply_multi_ship_starboard(self, ship, stand_on=False, debug=False):
         """
         Attempts to adjust a ship's heading to improve its CPA relative to other ships.
@@ -235,20 +454,33 @@ class Simulator:
             if debug:
                 print(f"{get_color_name(ship.color)} has no remaining turn allowed (stand_on={stand_on}).")
             return False
-        current_cpa = self.compute_min_cpa_over_others(ship, base_heading)
-        best_cpa = current_cpa
-        best_offset = 0.0
-        step = self.heading_search_step
-        increments = np.arange(step, remaining_turn + 0.0001, step)
-        for offset in increments:
-            test_heading = base_heading - offset
-            test_cpa = self.compute_min_cpa_over_others(ship, test_heading)
-            if test_cpa > best_cpa:
-                best_cpa = test_cpa
-                best_offset = offset
-        if best_offset > 0:
+        offsets = self._offsets[:self._num_offset_steps(remaining_turn) + 1]
+        if len(offsets) >= COARSE_SEARCH_MIN_CANDIDATES:
+            if NUMBA_AVAILABLE and len(offsets) * len(self.ships) < COARSE_SEARCH_STRIDE * PARALLEL_MIN_EVALUATIONS:
+                # Run both passes in one compiled call.
+                idx = self._index[id(ship)]
+                best_idx, current_cpa, best_cpa = coarse_then_fine_offset(
+                    idx, self._x, self._y, self._vx, self._vy, self._spd, base_heading, offsets,
+                    COARSE_SEARCH_STRIDE, self._sufficient_bound())
+            else:
+                best_idx, current_cpa, best_cpa = self.search_coarse_then_fine(ship, base_heading, offsets)
+        elif NUMBA_AVAILABLE and len(offsets) * len(self.ships) < PARALLEL_MIN_EVALUATIONS:
+            # Run the whole exhaustive search in the compiled kernel.
+            idx = self._index[id(ship)]
+            best_idx, current_cpa, best_cpa = best_starboard_offset(
+                idx, self._x, self._y, self._vx, self._vy, self._spd, base_heading, offsets,
+                self._sufficient_bound())
+        else:
+            # Evaluate the current heading (offset 0) and every candidate starboard offset in one pass.
+            min_cpas = self.compute_min_cpa_for_headings(ship, base_heading - offsets)
+            current_cpa = min_cpas[0]
+            # The first offset with the largest CPA wins; offset 0 wins ties, i.e. no CPA improvement.
+            best_idx = self._pick_offset(min_cpas, True)
+            best_cpa = min_cpas[best_idx]
+        best_offset = offsets[best_idx]
+        if best_idx > 0 and best_cpa > current_cpa:
             new_heading = base_heading - best_offset
-            ship.heading = new_heading
+            self._set_heading(ship, new_heading)
             ship.heading_adjusted += best_offset
             if debug:
                 print(f"{get_color_name(ship.color)} improved CPA: {current_cpa:.3f} -> {best_cpa:.3f} by turning {best_offset:.1f} deg")
@@ -257,6 +489,81 @@ class Simulator:
             print(f"{get_color_name(ship.color)} no offset improves CPA (stand_on={stand_on}).")
         return False
 
+    def _num_offset_steps(self, max_turn):
+        """
+        Counts the non-zero starboard offsets (multiples of heading_search_step) within max_turn.
+
+        Parameters:
+            max_turn (float): The largest allowed turn (in degrees); a small tolerance keeps max_turn
+                itself when it is a multiple of the step.
+
+        Returns:
+            int: The number of offsets k * step (k >= 1) to evaluate.
+        """
+        step = self.heading_search_step
+        return max(0, math.ceil((max_turn + 0.0001 - step) / step))
+
+    def search_coarse_then_fine(self, ship, base_heading, offsets):
+        """
+        Finds the starboard offset with the largest minimum CPA using a coarse pass and a local refinement.
+
+        The coarse pass evaluates every COARSE_SEARCH_STRIDE-th offset (always including offset 0).
+        The refinement then evaluates the offsets within one coarse stride on either side of the best
+        coarse offset. This needs far fewer CPA evaluations than the exhaustive search for large
+        candidate sets, at the cost of possibly missing a narrow optimum between coarse samples.
+        Both passes honour sufficient_cpa (see _pick_offset).
+
+        Parameters:
+            ship (Ship): The ship whose heading is searched.
+            base_heading (float): The ship's heading before the turn (in degrees).
+            offsets (numpy.ndarray): Candidate starboard offsets, starting with 0.
+
+        Returns:
+            tuple: (best_idx, current_cpa, best_cpa)
+                - best_idx (int): Index into offsets of the best offset (the smallest offset wins ties).
+                - current_cpa (float): The minimum CPA when keeping the current heading (offset 0).
+                - best_cpa (float): The minimum CPA at the best offset.
+        """
+        stride = COARSE_SEARCH_STRIDE
+        coarse_cpas = self.compute_min_cpa_for_headings(ship, base_heading - offsets[::stride])
+        current_cpa = coarse_cpas[0]
+        center = self._pick_offset(coarse_cpas, True) * stride
+        lo = max(0, center - stride + 1)
+        fine_cpas = self.compute_min_cpa_for_headings(ship, base_heading - offsets[lo:center + stride])
+        best = self._pick_offset(fine_cpas, lo == 0)
+        return lo + best, current_cpa, fine_cpas[best]
+
+    def _sufficient_bound(self):
+        """
+        Returns sufficient_cpa as the kernels expect it: inf when no early stop is configured.
+        """
+        return np.inf if self.sufficient_cpa is None else float(self.sufficient_cpa)
+
+    def _pick_offset(self, min_cpas, starts_at_zero):
+        """
+        Picks the winning entry of a run of consecutive starboard offsets' minimum CPAs.
+
+        Normally this is the first entry with the largest CPA. With sufficient_cpa set, it is instead the
+        first non-zero offset that improves on every earlier entry and reaches sufficient_cpa, falling
+        back to the largest CPA when none does; this matches the early stop of the compiled searches.
+
+        Parameters:
+            min_cpas (numpy.ndarray): Minimum CPA (in NM) of each offset, in increasing offset order.
+            starts_at_zero (bool): True if min_cpas[0] belongs to offset 0 (keeping the current heading).
+
+        Returns:
+            int: Index into min_cpas of the winning offset.
+        """
+        best = int(np.argmax(min_cpas))
+        if self.sufficient_cpa is None:
+            return best
+        prev_max = np.concatenate(([-np.inf], np.maximum.accumulate(min_cpas)[:-1]))
+        hits = (min_cpas > prev_max) & (min_cpas >= self.sufficient_cpa)
+        if starts_at_zero:
+            hits[0] = False
+        hits = np.flatnonzero(hits)
+        return int(hits[0]) if len(hits) else best
+
     def compute_min_cpa_over_others(self, give_ship, test_heading):
         """
         Computes the minimum CPA for a given ship against all other ships, if the ship used a specified test heading.
@@ -268,37 +575,66 @@ class Simulator:
         Returns:
             float: The minimum CPA (in NM).
         """
-        old_heading = give_ship.heading
-        give_ship.heading = test_heading
-        min_cpa = float('inf')
-        for s in self.ships:
-            if s is not give_ship:
-                dist_cpa, _ = compute_cpa_and_tcpa(give_ship, s)
-                if dist_cpa < min_cpa:
-                    min_cpa = dist_cpa
-        give_ship.heading = old_heading
-        return min_cpa
+        return float(self.compute_min_cpa_for_headings(give_ship, np.array([test_heading]))[0])
 
-    def revert_heading_with_clamp(self, ship):
+    def compute_min_cpa_for_headings(self, give_ship, test_headings):
         """
-        Reverts a ship's heading toward its destination, limited by the maximum allowed turn.
+        Computes, for each of several test headings, the minimum CPA of a given ship against all other ships.
+
+        All headings are evaluated at once by broadcasting the candidate velocities (H, 2) against the
+        other ships' positions and velocities (M, 2), or by the compiled min_cpa_for_headings kernel
+        when Numba is available (its parallel variant for large searches). Very large searches run on
+        the GPU when CuPy is available (see cpa_gpu). The ship's own heading is not modified.
 
         Parameters:
-            ship (Ship): The ship whose heading is to be reverted.
-        """
-        curr_hd = ship.heading
-        dest_hd = ship.compute_heading_to_destination()
-        diff = dest_hd - curr_hd
-        while diff > 180:
-            diff -= 360
-        while diff <= -180:
-            diff += 360
+            give_ship (Ship): The ship for which to compute the CPA.
+            test_headings (numpy.ndarray): The headings to test (in degrees), shape (H,).
+
+        Returns:
+            numpy.ndarray: The minimum CPA (in NM) for each test heading, shape (H,).
+        """
+        if CUPY_AVAILABLE and len(test_headings) * len(self.ships) >= GPU_MIN_EVALUATIONS:
+            return min_cpa_for_headings_gpu(self._index[id(give_ship)], self._x, self._y, self._vx, self._vy,
+                                            self._spd, test_headings)
+        if NUMBA_AVAILABLE:
+            idx = self._index[id(give_ship)]
+            if len(test_headings) * len(self.ships) >= PARALLEL_MIN_EVALUATIONS:
+                kernel = min_cpa_for_headings_parallel
+            else:
+                kernel = min_cpa_for_headings
+            return kernel(idx, self._x, self._y, self._vx, self._vy, self._spd,
+                          np.asarray(test_headings, dtype=np.float64))
+        if len(self.ships) < 2:
+            return np.full(len(test_headings), float('inf'))
+        others = np.arange(len(self.ships)) != self._index[id(give_ship)]
+        P_other = np.stack([self._x[others], self._y[others]], axis=-1)
+        V_other = np.stack([self._vx[others], self._vy[others]], axis=-1)
+        rad = np.radians(test_headings)
+        V_test = np.stack([give_ship.speed * np.cos(rad), give_ship.speed * np.sin(rad)], axis=-1)
+        r0 = P_other - (give_ship.x, give_ship.y)                # (M, 2), broadcast over headings
+        v_rel = V_other[None, :, :] - V_test[:, None, :]        # (H, M, 2)
+        dist, _ = compute_cpa_and_tcpa_arrays(np.broadcast_to(r0, v_rel.shape), v_rel)
+        return dist.min(axis=1)
+
+    def revert_headings_with_clamp(self, mask):
+        """
+        Reverts the selected ships' headings toward their destinations, each limited by the maximum
+        allowed turn. The turns are computed for all selected ships at once from the SoA buffers.
+
+        Parameters:
+            mask (numpy.ndarray): Boolean array selecting the ships (in self.ships order) to revert.
+        """
+        idxs = np.flatnonzero(mask)
+        if len(idxs) == 0:
+            return
+        curr_hd = self._hdg[idxs]
+        dest_hd = np.degrees(np.arctan2(self._dy[idxs] - self._y[idxs], self._dx[idxs] - self._x[idxs]))
+        # Shortest signed turn, wrapped into (-180, 180].
+        diff = 180.0 - np.remainder(180.0 - (dest_hd - curr_hd), 360.0)
         max_turn = self.heading_search_range
-        if diff > max_turn:
-            diff = max_turn
-        elif diff < -max_turn:
-            diff = -max_turn
-        ship.heading = curr_hd + diff
+        np.clip(diff, -max_turn, max_turn, out=diff)
+        for idx, heading in zip(idxs.tolist(), (curr_hd + diff).tolist()):
+            self._set_heading(self.ships[idx], heading)
 
     def all_ships_arrived(self):
         """
@@ -307,27 +643,56 @@ class Simulator:
         Returns:
             bool: True if every ship's distance to destination is below the threshold; otherwise, False.
         """
-        return all(s.distance_to_destination() < self.destination_threshold for s in self.ships)
+        return bool(np.all(self._dist_dest < self.destination_threshold))
 
     def get_collisions_with_roles(self):
         """
         Retrieves a list of collisions along with assigned roles for each encounter.
 
+        The list is computed at most once per state_version: repeated calls while no ship has moved or
+        turned return the same list without re-running collision detection.
+
         Returns:
             list of tuples: Each tuple contains (dist_cpa, i, j, encounter, roleA, roleB).
         """
+        if self._roles_cache is not None and self._roles_cache[0] == self.state_version:
+            return self._roles_cache[1]
         results = []
-        collisions = self.detect_collisions()
-        for dist_cpa, t_cpa, i, j in collisions:
+        for dist_cpa, t_cpa, i, j in self.detect_collisions():
             if dist_cpa >= 3 * self.safe_distance:
                 continue
-            shipA = self.ships[i]
-            shipB = self.ships[j]
-            encounter = classify_encounter(shipA, shipB)
-            roleA, roleB = self.assign_roles(shipA, shipB, encounter)
+            encounter, (roleA, roleB), _ = self.classify_pair(i, j)
             results.append((dist_cpa, i, j, encounter, roleA, roleB))
+        self._roles_cache = (self.state_version, results)
         return results
 
+    def classify_pair(self, i, j):
+        """
+        Classifies the encounter between ships i and j and assigns their roles, reusing the result
+        computed earlier in the same step while neither ship's heading has changed.
+
+        Parameters:
+            i, j (int): Indices of the two ships.
+
+        Returns:
+            tuple: (encounter, roles, bearingAB)
+                - encounter (str): 'head-on', 'crossing', or 'overtaking'.
+                - roles (tuple): (roleA, roleB), see assign_roles.
+                - bearingAB (float): Relative bearing of ship j as seen from ship i (in degrees).
+        """
+        shipA = self.ships[i]
+        shipB = self.ships[j]
+        cached = self._pair_cache.get((i, j))
+        if cached is not None and cached[0] == shipA.heading and cached[1] == shipB.heading:
+            return cached[2]
+        bearingAB = relative_bearing_degs(shipA, shipB)
+        bearingBA = relative_bearing_degs(shipB, shipA)
+        encounter = classify_encounter_from_bearings(bearingAB, bearingBA)
+        roles = self.roles_from_bearings(encounter, bearingAB, bearingBA)
+        info = (encounter, roles, bearingAB)
+        self._pair_cache[(i, j)] = (shipA.heading, shipB.heading, info)
+        return info
+
     def assign_roles(self, shipA, shipB, encounter_type):
         """
         Determines the roles (Give-Way or Stand-On) for two ships based on the encounter type.
@@ -337,21 +702,35 @@ class Simulator:
             shipB (Ship): The second ship.
             encounter_type (str): The type of encounter ('head-on', 'crossing', or 'overtaking').
 
+        Returns:
+            tuple: (roleA, roleB) where each role is a string ("Give-Way" or "Stand-On").
+        """
+        return self.roles_from_bearings(encounter_type, relative_bearing_degs(shipA, shipB),
+                                        relative_bearing_degs(shipB, shipA))
+
+    def roles_from_bearings(self, encounter_type, bearingAB, bearingBA):
+        """
+        Determines the roles (Give-Way or Stand-On) for two ships from their relative bearings.
+
+        Parameters:
+            encounter_type (str): The type of encounter ('head-on', 'crossing', or 'overtaking').
+            bearingAB (float): Relative bearing of shipB as seen from shipA (in degrees).
+            bearingBA (float): Relative bearing of shipA as seen from shipB (in degrees).
+
         Returns:
             tuple: (roleA, roleB) where each role is a string ("Give-Way" or "Stand-On").
         """
         if encounter_type == 'head-on':
             return ("Give-Way", "Give-Way")
         elif encounter_type == 'crossing':
-            if is_on_starboard_side(shipA, shipB):
+            if is_starboard_bearing(bearingAB):
                 return ("Give-Way", "Stand-On")
-            elif is_on_starboard_side(shipB, shipA):
+            elif is_starboard_bearing(bearingBA):
                 return ("Stand-On", "Give-Way")
             else:
                 return ("Give-Way", "Stand-On")
         else:
-            bearingAB = abs(relative_bearing_degs(shipA, shipB))
-            if 112.5 < bearingAB < 250:
+            if 112.5 < abs(bearingAB) < 250:
                 return ("Stand-On", "Give-Way")
             else:
                 return ("Give-Way", "Stand-On")
@@ -15,24 +15,31 @@ It also provides helper functions:
 
 import pygame
 import json
-import tkinter as tk
-import tkinter.filedialog as fd
-from config import BASE_RESOLUTIONS, BG_COLOR, BG_SCROLL_SPEED
+from config import BASE_RESOLUTIONS, BG_SCROLL_SPEED
 from draw_utils import draw_button, draw_scrolling_bg
 from states.simulation_ui import SimulationState
-from resource_path import resource_path
+from assets import load_background, load_logo, load_font
+
+# Hidden Tkinter root window that owns the file dialogs; created on first use and then reused.
+_tk_root = None
 
 def load_json_file():
     """
     Opens a file dialog to allow the user to select a JSON file and loads the file.
 
+    Tkinter is imported and its interpreter started on the first call only; later calls reuse the
+    hidden root window.
+
     Returns:
         dict or None: The JSON data as a dictionary if loaded successfully; otherwise, None.
     """
-    root = tk.Tk()
-    root.withdraw()  # Hide the main Tkinter window.
-    file_path = fd.askopenfilename(filetypes=[("JSON Files", "*.json")])
-    root.destroy()
+    import tkinter as tk
+    import tkinter.filedialog as fd
+    global _tk_root
+    if _tk_root is None:
+        _tk_root = tk.Tk()
+        _tk_root.withdraw()  # Hide the main Tkinter window.
+    file_path = fd.askopenfilename(parent=_tk_root, filetypes=[("JSON Files", "*.json")])
     if file_path:
         try:
             with open(file_path, "r") as f:
@@ -122,7 +129,10 @@ class AutoModeState:
             screen (pygame.Surface): The main display surface.
         """
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 28)
+        self.font = load_font(None, 28)
+        # Pre-rendered button captions (the font does not change with the window scale).
+        self._button_labels = {key: self.font.render(text, True, (255, 255, 255))
+                               for key, text in (("back", "Back"), ("load", "Load JSON"), ("start", "Start"))}
         self.next_state = None
         self.base_resolution = BASE_RESOLUTIONS["auto_mode"]
         # Define buttons for navigation.
@@ -132,11 +142,13 @@ class AutoModeState:
             "start": pygame.Rect(300, 350, 200, 50)
         }
         self.warning_msg = ""           # Holds warning or status messages.
+        self._warning_cache = ("", None)  # (message, rendered surface) of the last drawn warning.
         self.automatic_loaded_ok = False  # Flag indicating whether valid JSON data has been loaded.
         self.json_data = None           # Holds the loaded JSON data.
-        self.bg_img = None              # Background image.
-        self.logo_img = None            # Logo image.
         self.bg_scroll_x = 0.0          # Current horizontal scroll offset for the background.
+        self._layout_size = None        # Window size the scaled buttons were computed for.
+        self.bg_img = load_background()   # Background image (shared across states).
+        self.logo_img = load_logo()       # Logo image (shared across states).
 
     def handle_events(self, events):
         """
@@ -179,40 +191,24 @@ class AutoModeState:
         Parameters:
             dt (float): The elapsed time in seconds since the last update.
         """
-        current_w, current_h = self.screen.get_size()
-        base_w, base_h = self.base_resolution
-        self.scale_x = current_w / base_w
-        self.scale_y = current_h / base_h
-        self.scaled_buttons = {}
-        for key, rect in self.buttons.items():
-            self.scaled_buttons[key] = pygame.Rect(
-                int(rect.x * self.scale_x),
-                int(rect.y * self.scale_y),
-                int(rect.width * self.scale_x),
-                int(rect.height * self.scale_y)
-            )
-        # Load and update background image.
-        if self.bg_img is None:
-            try:
-                self.bg_img = pygame.image.load(resource_path("images/sea_bg.png")).convert()
-            except Exception as e:
-                print("Error loading sea_bg:", e)
-                self.bg_img = pygame.Surface((800, 600))
-                self.bg_img.fill((0, 100, 200))
-        if self.bg_img:
-            self.bg_scroll_x = draw_scrolling_bg(self.screen, self.bg_img, self.bg_scroll_x, BG_SCROLL_SPEED, dt)
-        # Load logo if not already loaded.
-        if self.logo_img is None:
-            try:
-                # Load the logo image.
-                logo = pygame.image.load(resource_path("images/logo.png")).convert_alpha()
-                # Expand the logo: scale it by a factor of 2 (or adjust as needed).
-                self.logo_img = pygame.transform.scale(logo, (logo.get_width() * 2, logo.get_height() * 2))
-            except Exception as e:
-                print("Error loading logo:", e)
-                self.logo_img = pygame.Surface((200, 100), pygame.SRCALPHA)
-                pygame.draw.rect(self.logo_img, (255, 255, 255, 180), self.logo_img.get_rect())
-
+        # Rescale the buttons only when the window size changes.
+        current_size = self.screen.get_size()
+        if current_size != self._layout_size:
+            self._layout_size = current_size
+            current_w, current_h = current_size
+            base_w, base_h = self.base_resolution
+            self.scale_x = current_w / base_w
+            self.scale_y = current_h / base_h
+            self.scaled_buttons = {
+                key: pygame.Rect(int(rect.x * self.scale_x), int(rect.y * self.scale_y),
+                                 int(rect.width * self.scale_x), int(rect.height * self.scale_y))
+                for key, rect in self.buttons.items()
+            }
+            # Positions of the logo (centered at the top) and the warning message.
+            self._logo_pos = ((current_w - self.logo_img.get_width()) // 2, int(30 * self.scale_y))
+            self._warning_pos = (int(200 * self.scale_x), int(450 * self.scale_y))
+        # Update the background scroll position.
+        self.bg_scroll_x = draw_scrolling_bg(self.screen, self.bg_img, self.bg_scroll_x, BG_SCROLL_SPEED, dt)
 
     def render(self, screen):
         """
@@ -221,24 +217,21 @@ class AutoModeState:
         Parameters:
             screen (pygame.Surface): The display surface.
         """
-        # Draw background (if already drawn in update, no further action needed).
-        if self.bg_img:
-            pass
-        else:
-            screen.fill(BG_COLOR)
-        # Draw logo at the top center.
-        if self.logo_img:
-            logo_x = (screen.get_width() - self.logo_img.get_width()) // 2
-            logo_y = int(30 * self.scale_y)
-            screen.blit(self.logo_img, (logo_x, logo_y))
+        # The background was already drawn in update. Draw the logo at the top center.
+        screen.blit(self.logo_img, self._logo_pos)
         # Draw UI buttons.
-        draw_button(screen, self.scaled_buttons["back"], "Back", self.font, color=(0, 100, 180))
-        draw_button(screen, self.scaled_buttons["load"], "Load JSON", self.font, color=(0, 100, 180))
-        draw_button(screen, self.scaled_buttons["start"], "Start", self.font, color=(0, 100, 180))
+        draw_button(screen, self.scaled_buttons["back"], "Back", self.font, color=(0, 100, 180),
+                    label=self._button_labels["back"])
+        draw_button(screen, self.scaled_buttons["load"], "Load JSON", self.font, color=(0, 100, 180),
+                    label=self._button_labels["load"])
+        draw_button(screen, self.scaled_buttons["start"], "Start", self.font, color=(0, 100, 180),
+                    label=self._button_labels["start"])
         # Display any warning or status message.
+        # The rendered text is reused until the message changes.
         if self.warning_msg:
-            warning = self.font.render(self.warning_msg, True, (255, 0, 0))
-            screen.blit(warning, (int(200 * self.scale_x), int(450 * self.scale_y)))
+            if self._warning_cache[0] != self.warning_msg:
+                self._warning_cache = (self.warning_msg, self.font.render(self.warning_msg, True, (255, 0, 0)))
+            screen.blit(self._warning_cache[1], self._warning_pos)
     
     def get_next_state(self):
         """
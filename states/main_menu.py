@@ -9,9 +9,9 @@ to the Manual Mode, Automatic Mode, or exit the application.
 """
 
 import pygame
-from config import BASE_RESOLUTIONS, BG_COLOR, BG_SCROLL_SPEED
+from config import BASE_RESOLUTIONS, BG_SCROLL_SPEED
 from draw_utils import draw_button, draw_scrolling_bg
-from resource_path import resource_path
+from assets import load_background, load_logo, load_font
 from states.manual_scenario import ManualScenarioState
 from states.auto_mode import AutoModeState
 
@@ -24,7 +24,11 @@ class MainMenuState:
             screen (pygame.Surface): The main display surface.
         """
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 28)
+        self.font = load_font(None, 28)
+        # Pre-rendered button captions (the font does not change with the window scale).
+        self._button_labels = {key: self.font.render(text, True, (255, 255, 255))
+                               for key, text in (("manual", "Manual Mode"), ("auto", "Automatic Mode"),
+                                                 ("exit", "Exit"))}
         self.next_state = None
         self.base_resolution = BASE_RESOLUTIONS["main_menu"]
         # Define base button positions (x, y, width, height)
@@ -35,9 +39,10 @@ class MainMenuState:
         }
         self.scale_x = 1.0
         self.scale_y = 1.0
-        self.bg_img = None      # Background image
-        self.logo_img = None    # Logo image
         self.bg_scroll_x = 0.0  # Horizontal scroll offset for the background
+        self._layout_size = None  # Window size the scaled buttons were computed for
+        self.bg_img = load_background()  # Background image (shared across states)
+        self.logo_img = load_logo()      # Logo image (shared across states)
 
     def handle_events(self, events):
         """
@@ -64,38 +69,31 @@ class MainMenuState:
         """
         Updates the main menu state.
 
-        This function scales the button positions according to the current screen size and
+        This function scales the button positions when the screen size changes and
         updates the background scrolling offset.
 
         Parameters:
             dt (float): Elapsed time in seconds since the last update.
         """
-        current_w, current_h = self.screen.get_size()
-        base_w, base_h = self.base_resolution
-        # Calculate scale factors for horizontal and vertical dimensions.
-        self.scale_x = current_w / base_w
-        self.scale_y = current_h / base_h
-        self.scaled_buttons = {}
-        # Scale each button's rectangle.
-        for key, rect in self.buttons.items():
-            self.scaled_buttons[key] = pygame.Rect(
-                int(rect.x * self.scale_x),
-                int(rect.y * self.scale_y),
-                int(rect.width * self.scale_x),
-                int(rect.height * self.scale_y)
-            )
-        # Load background image if not already loaded.
-        if self.bg_img is None:
-            try:
-                self.bg_img = pygame.image.load(resource_path("images/sea_bg.png")).convert()
-            except Exception as e:
-                print("Error loading sea_bg:", e)
-                self.bg_img = pygame.Surface((800, 600))
-                self.bg_img.fill((0, 100, 200))
-
-        # Update background scroll position if a background image is available.
-        if self.bg_img:
-            self.bg_scroll_x = draw_scrolling_bg(self.screen, self.bg_img, self.bg_scroll_x, BG_SCROLL_SPEED, dt)
+        # Rescale the buttons only when the window size changes.
+        current_size = self.screen.get_size()
+        if current_size != self._layout_size:
+            self._layout_size = current_size
+            current_w, current_h = current_size
+            base_w, base_h = self.base_resolution
+            # Calculate scale factors for horizontal and vertical dimensions.
+            self.scale_x = current_w / base_w
+            self.scale_y = current_h / base_h
+            # Scale each button's rectangle.
+            self.scaled_buttons = {
+                key: pygame.Rect(int(rect.x * self.scale_x), int(rect.y * self.scale_y),
+                                 int(rect.width * self.scale_x), int(rect.height * self.scale_y))
+                for key, rect in self.buttons.items()
+            }
+            # Position of the logo (centered at the top).
+            self._logo_pos = ((current_w - self.logo_img.get_width()) // 2, int(30 * self.scale_y))
+        # Update the background scroll position.
+        self.bg_scroll_x = draw_scrolling_bg(self.screen, self.bg_img, self.bg_scroll_x, BG_SCROLL_SPEED, dt)
 
     def render(self, screen):
         """
@@ -104,29 +102,15 @@ class MainMenuState:
         Parameters:
             screen (pygame.Surface): The display surface.
         """
-        # If the background image exists, it was drawn during update; otherwise, fill with BG_COLOR.
-        if not self.bg_img:
-            screen.fill(BG_COLOR)
-        # Load and draw the logo if not already loaded.
-        if self.logo_img is None:
-            try:
-                # Load the logo image.
-                logo = pygame.image.load(resource_path("images/logo.png")).convert_alpha()
-                # Expand the logo: scale it by a factor of 2 (or adjust as needed).
-                self.logo_img = pygame.transform.scale(logo, (logo.get_width() * 2, logo.get_height() * 2))
-            except Exception as e:
-                print("Error loading logo:", e)
-                self.logo_img = pygame.Surface((200, 100), pygame.SRCALPHA)
-                pygame.draw.rect(self.logo_img, (255, 255, 255, 180), self.logo_img.get_rect())
-
-        if self.logo_img:
-            logo_x = (screen.get_width() - self.logo_img.get_width()) // 2
-            logo_y = int(30 * self.scale_y)
-            screen.blit(self.logo_img, (logo_x, logo_y))
+        # The background was already drawn during update. Draw the logo at the top center.
+        screen.blit(self.logo_img, self._logo_pos)
         # Draw the buttons.
-        draw_button(screen, self.scaled_buttons["manual"], "Manual Mode", self.font, color=(0, 100, 180))
-        draw_button(screen, self.scaled_buttons["auto"], "Automatic Mode", self.font, color=(0, 100, 180))
-        draw_button(screen, self.scaled_buttons["exit"], "Exit", self.font, color=(0, 100, 180))
+        draw_button(screen, self.scaled_buttons["manual"], "Manual Mode", self.font, color=(0, 100, 180),
+                    label=self._button_labels["manual"])
+        draw_button(screen, self.scaled_buttons["auto"], "Automatic Mode", self.font, color=(0, 100, 180),
+                    label=self._button_labels["auto"])
+        draw_button(screen, self.scaled_buttons["exit"], "Exit", self.font, color=(0, 100, 180),
+                    label=self._button_labels["exit"])
 
     def get_next_state(self):
         """
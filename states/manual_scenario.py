@@ -11,8 +11,8 @@ according to specified rules before proceeding to the Manual Ship Setup state.
 """
 
 import pygame
-from config import BASE_RESOLUTIONS, BG_COLOR, BG_SCROLL_SPEED
-from resource_path import resource_path
+from config import BASE_RESOLUTIONS, BG_SCROLL_SPEED
+from assets import load_background, load_font
 from ui_component import TextBox
 from draw_utils import draw_button, draw_scrolling_bg
 from states.manual_ship_setup import ManualShipSetupState
@@ -26,7 +26,10 @@ class ManualScenarioState:
             screen (pygame.Surface): The main display surface.
         """
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 28)
+        self.font = load_font(None, 28)
+        # Pre-rendered button captions (the font does not change with the window scale).
+        self._button_labels = {key: self.font.render(text, True, (255, 255, 255))
+                               for key, text in (("back", "Back"), ("next", "Next"))}
         self.base_resolution = BASE_RESOLUTIONS["manual_scenario"]
         self.next_state = None
         
@@ -53,12 +56,18 @@ class ManualScenarioState:
         }
         
         # For moving background.
-        self.bg_img = None
+        self.bg_img = load_background()
         self.bg_scroll_x = 0.0
         self.last_dt = 0.0
+        self._layout_size = None  # Window size the scaled buttons and textboxes were computed for.
         
         # String to hold any validation warning messages.
         self.warning_msg = ""
+        self._warning_cache = ("", None)  # (message, rendered surface) of the last drawn warning.
+
+        # Pre-rendered labels shown left of the textboxes (the font size does not change with scale).
+        labels = ["Map Size:", "Safety Zone:", "Heading Range:", "Heading Step:", "Time Step:", "#Ships:"]
+        self._label_surfs = [self.font.render(label_text, True, (255, 255, 255)) for label_text in labels]
 
     def validate_inputs(self):
         """
@@ -139,47 +148,43 @@ class ManualScenarioState:
                         }
                         self.scenario_data = scenario_data
                         self.next_state = ManualShipSetupState(self.screen, scenario_data)
-            # Forward the event to each textbox for text input.
-            for tb in self.text_boxes:
-                tb.handle_event(event)
+            # Forward clicks and key presses to each textbox for text input.
+            if event.type in TextBox.HANDLED_EVENTS:
+                for tb in self.text_boxes:
+                    tb.handle_event(event)
 
     def update(self, dt):
         """
         Updates the state of the manual scenario screen.
 
-        This includes saving the elapsed time for background scrolling, scaling the UI elements
-        based on the current window size, and loading the background image if necessary.
+        This includes saving the elapsed time for background scrolling and, when the window size
+        changes, scaling the UI elements to the new size.
 
         Parameters:
             dt (float): Elapsed time in seconds since the last update.
         """
         self.last_dt = dt  # Save dt for use in render() for background scrolling.
-        current_w, current_h = self.screen.get_size()
-        base_w, base_h = self.base_resolution
-        self.scale_x = current_w / base_w
-        self.scale_y = current_h / base_h
-        
-        # Scale button positions.
-        self.scaled_buttons = {}
-        for key, rect in self.buttons.items():
-            self.scaled_buttons[key] = pygame.Rect(
-                int(rect.x * self.scale_x),
-                int(rect.y * self.scale_y),
-                int(rect.width * self.scale_x),
-                int(rect.height * self.scale_y)
-            )
-        # Update the rectangle for each textbox.
-        for tb in self.text_boxes:
-            tb.update_rect(self.scale_x, self.scale_y)
-        # Load background image if not already loaded.
-        if self.bg_img is None:
-            try:
-                self.bg_img = pygame.image.load(resource_path("images/sea_bg.png")).convert()
-            except Exception as e:
-                print("Error loading sea_bg:", e)
-                self.bg_img = pygame.Surface((800, 600))
-                self.bg_img.fill((0, 100, 200))
-
+        # Rescale the buttons and textboxes only when the window size changes.
+        current_size = self.screen.get_size()
+        if current_size != self._layout_size:
+            self._layout_size = current_size
+            current_w, current_h = current_size
+            base_w, base_h = self.base_resolution
+            self.scale_x = current_w / base_w
+            self.scale_y = current_h / base_h
+
+            # Scale button positions.
+            self.scaled_buttons = {
+                key: pygame.Rect(int(rect.x * self.scale_x), int(rect.y * self.scale_y),
+                                 int(rect.width * self.scale_x), int(rect.height * self.scale_y))
+                for key, rect in self.buttons.items()
+            }
+            # Update the rectangle for each textbox.
+            for tb in self.text_boxes:
+                tb.update_rect(self.scale_x, self.scale_y)
+            # (label, position) pairs that place each label left of its textbox, for one blits() call.
+            self._label_blits = [(label, (tb.rect.x - label.get_width() - 5, tb.rect.y))
+                                 for tb, label in zip(self.text_boxes, self._label_surfs)]
 
     def render(self, screen):
         """
@@ -190,23 +195,21 @@ class ManualScenarioState:
             screen (pygame.Surface): The display surface.
         """
         # Draw scrolling background.
-        if self.bg_img:
-            self.bg_scroll_x = draw_scrolling_bg(screen, self.bg_img, self.bg_scroll_x, BG_SCROLL_SPEED, self.last_dt)
-        else:
-            screen.fill(BG_COLOR)
-        # Draw labels and textboxes.
-        labels = ["Map Size:", "Safety Zone:", "Heading Range:", "Heading Step:", "Time Step:", "#Ships:"]
-        for tb, label_text in zip(self.text_boxes, labels):
-            label = self.font.render(label_text, True, (255, 255, 255))
-            screen.blit(label, (tb.rect.x - label.get_width() - 5, tb.rect.y))
+        self.bg_scroll_x = draw_scrolling_bg(screen, self.bg_img, self.bg_scroll_x, BG_SCROLL_SPEED, self.last_dt)
+        # Draw labels (in a single batched call) and textboxes.
+        screen.blits(self._label_blits, doreturn=False)
+        for tb in self.text_boxes:
             tb.draw(screen)
         # Draw the Back and Next buttons.
-        draw_button(screen, self.scaled_buttons["back"], "Back", self.font, color=(0, 100, 180))
-        draw_button(screen, self.scaled_buttons["next"], "Next", self.font, color=(0, 100, 180))
-        # Display a warning message (if any) below the textboxes.
+        draw_button(screen, self.scaled_buttons["back"], "Back", self.font, color=(0, 100, 180),
+                    label=self._button_labels["back"])
+        draw_button(screen, self.scaled_buttons["next"], "Next", self.font, color=(0, 100, 180),
+                    label=self._button_labels["next"])
+        # Display a warning message (if any) below the textboxes, reusing the rendered text until it changes.
         if self.warning_msg:
-            warning = self.font.render(self.warning_msg, True, (255, 0, 0))
-            screen.blit(warning, (300 * self.scale_x, 400 * self.scale_y))
+            if self._warning_cache[0] != self.warning_msg:
+                self._warning_cache = (self.warning_msg, self.font.render(self.warning_msg, True, (255, 0, 0)))
+            screen.blit(self._warning_cache[1], (300 * self.scale_x, 400 * self.scale_y))
 
     def get_next_state(self):
         """
@@ -10,8 +10,8 @@ visualize the ship positions.
 """
 
 import pygame
-from config import BASE_RESOLUTIONS, BG_COLOR, BG_SCROLL_SPEED
-from resource_path import resource_path
+from config import BASE_RESOLUTIONS, BG_SCROLL_SPEED
+from assets import load_background, load_font
 from ui_component import TextBox
 from draw_utils import draw_button, draw_minimap, draw_scrolling_bg
 import math
@@ -53,7 +53,10 @@ class ManualShipSetupState:
             scenario_data (dict): Dictionary containing scenario parameters (e.g., map size).
         """
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 28)
+        self.font = load_font(None, 28)
+        # Pre-rendered button captions (the font does not change with the window scale).
+        self._button_labels = {key: self.font.render(text, True, (255, 255, 255))
+                               for key, text in (("back", "Back"), ("start", "Start"))}
         self.base_resolution = BASE_RESOLUTIONS["manual_ship_setup"]
         self.scenario_data = scenario_data
         # Create textboxes for each ship based on the number of ships.
@@ -67,9 +70,10 @@ class ManualShipSetupState:
         }
         
         # For moving background:
-        self.bg_img = None
+        self.bg_img = load_background()
         self.bg_scroll_x = 0.0
         self.last_dt = 0.0
+        self._layout_size = None  # Window size the scaled buttons and textboxes were computed for.
         
         # String to hold any validation warning messages.
         self.warning_msg = ""
@@ -220,41 +224,37 @@ class ManualShipSetupState:
                         self.scenario_data["ships"] = ships
                         from states.simulation_ui import SimulationState
                         self.next_state = SimulationState(self.screen, self.scenario_data)
-            for row in self.ship_boxes:
-                for tb in row:
-                    tb.handle_event(event)
+            # Forward clicks and key presses to each textbox for text input.
+            if event.type in TextBox.HANDLED_EVENTS:
+                for row in self.ship_boxes:
+                    for tb in row:
+                        tb.handle_event(event)
 
     def update(self, dt):
         """
-        Updates the manual ship setup state, including scaling UI elements and loading the background.
+        Updates the manual ship setup state, rescaling the UI elements when the window size changes.
 
         Parameters:
             dt (float): Elapsed time in seconds since the last update.
         """
         self.last_dt = dt
-        current_w, current_h = self.screen.get_size()
-        base_w, base_h = self.base_resolution
-        self.scale_x = current_w / base_w
-        self.scale_y = current_h / base_h
-        
-        self.scaled_buttons = {}
-        for key, rect in self.buttons.items():
-            self.scaled_buttons[key] = pygame.Rect(
-                int(rect.x * self.scale_x),
-                int(rect.y * self.scale_y),
-                int(rect.width * self.scale_x),
-                int(rect.height * self.scale_y)
-            )
-        for row in self.ship_boxes:
-            for tb in row:
-                tb.update_rect(self.scale_x, self.scale_y)
-        if self.bg_img is None:
-            try:
-                self.bg_img = pygame.image.load(resource_path("images/sea_bg.png")).convert()
-            except Exception as e:
-                print("Error loading sea_bg:", e)
-                self.bg_img = pygame.Surface((800, 600))
-                self.bg_img.fill((0, 100, 200))
+        # Rescale the buttons and textboxes only when the window size changes.
+        current_size = self.screen.get_size()
+        if current_size != self._layout_size:
+            self._layout_size = current_size
+            current_w, current_h = current_size
+            base_w, base_h = self.base_resolution
+            self.scale_x = current_w / base_w
+            self.scale_y = current_h / base_h
+
+            self.scaled_buttons = {
+                key: pygame.Rect(int(rect.x * self.scale_x), int(rect.y * self.scale_y),
+                                 int(rect.width * self.scale_x), int(rect.height * self.scale_y))
+                for key, rect in self.buttons.items()
+            }
+            for row in self.ship_boxes:
+                for tb in row:
+                    tb.update_rect(self.scale_x, self.scale_y)
 
     def render(self, screen):
         """
@@ -264,10 +264,7 @@ class ManualShipSetupState:
         Parameters:
             screen (pygame.Surface): The display surface.
         """
-        if self.bg_img:
-            self.bg_scroll_x = draw_scrolling_bg(screen, self.bg_img, self.bg_scroll_x, BG_SCROLL_SPEED, self.last_dt)
-        else:
-            screen.fill(BG_COLOR)
+        self.bg_scroll_x = draw_scrolling_bg(screen, self.bg_img, self.bg_scroll_x, BG_SCROLL_SPEED, self.last_dt)
         header = self.font.render("Speed | Start(x,y) | Dest(x,y) | Length(m) | Width(m)", True, (255,255,255))
         screen.blit(header, (80 * self.scale_x, 90 * self.scale_y))
         y = 150
@@ -277,8 +274,10 @@ class ManualShipSetupState:
             for tb in row:
                 tb.draw(screen)
             y += 60
-        draw_button(screen, self.scaled_buttons["back"], "Back", self.font, color=(0,100,180))
-        draw_button(screen, self.scaled_buttons["start"], "Start", self.font, color=(0,100,180))
+        draw_button(screen, self.scaled_buttons["back"], "Back", self.font, color=(0, 100, 180),
+                    label=self._button_labels["back"])
+        draw_button(screen, self.scaled_buttons["start"], "Start", self.font, color=(0, 100, 180),
+                    label=self._button_labels["start"])
         dummy_ships = []
         ship_colors = [(0,255,0), (255,255,0), (128,128,128), (0,0,0), (128,0,128)]
         for i, row in enumerate(self.ship_boxes):
@@ -11,12 +11,15 @@ trails, safety circles, and grid labels) onto the screen.
 """
 
 import pygame
-from config import BASE_RESOLUTIONS, LEFT_MARGIN, TOP_MARGIN, BOTTOM_MARGIN, UI_PANEL_HEIGHT, BG_COLOR
+from assets import load_font
+from config import (BASE_RESOLUTIONS, LEFT_MARGIN, TOP_MARGIN, BOTTOM_MARGIN, UI_PANEL_HEIGHT, BG_COLOR,
+                    MAX_TRAIL, SUFFICIENT_CPA_FACTOR)
 from draw_utils import (draw_grid, draw_ship_trail, draw_safety_circle, draw_ship_rect,
                         draw_star, draw_y_axis_labels_in_margin, draw_x_axis_labels_in_margin,
                         draw_dashed_line, draw_button)
 from simulator import Simulator
 from ship import Ship
+from trail import Trail
 
 class SimulationState:
     def __init__(self, screen, scenario_data=None):
@@ -36,7 +39,7 @@ class SimulationState:
           - Background scrolling variables.
         """
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 28)
+        self.font = load_font(None, 28)
         self.base_resolution = BASE_RESOLUTIONS["simulation"]
         self.next_state = None
         self.scenario_data = scenario_data if scenario_data is not None else {}
@@ -46,6 +49,17 @@ class SimulationState:
         self.compare_mode = False  # Flag to toggle drawing of dashed lines for original routes.
         self.sea_scroll_x = 0.0   # Horizontal scroll offset for the sea background.
         self.sea_scroll_speed = 30.0  # Scrolling speed in pixels per second.
+        self._layout_size = None      # Window size the scaled layout was computed for.
+        self.sim_font = None          # Scaled simulation font; rebuilt when the scale changes.
+        self.sim_font_size = None     # Point size sim_font was created with.
+        self._static_surfs = {}       # Pre-rendered labels that never change, keyed by name.
+        self._tick_label_surfs = {}   # Pre-rendered axis tick labels, keyed by label text.
+        self._bg = None               # Pre-rendered static background; see _ensure_background.
+        self._bg_key = None           # (window size, simulator) the background was built for.
+        self._bg_overlay_rects = []   # Background areas re-blitted on top of the ships.
+        self._trail_layer = None      # Copy of the background with the ship trails drawn in.
+        self._trail_steps = 0         # Points appended to every ship's trail since the simulation started.
+        self._trail_layer_steps = 0   # Value of _trail_steps when the trail layer was last brought up to date.
 
     def handle_events(self, events):
         """
@@ -94,8 +108,8 @@ class SimulationState:
         Updates the simulation state for the current time step.
 
         This includes:
-          - Scaling and layout: Calculates the scale factor based on the current window size,
-            determines the simulation area, margins, and positions of UI elements (buttons).
+          - Scaling and layout: When the window size changes, recalculates the scale factor, the
+            simulation area, margins, and positions of UI elements (see _update_layout).
           - Creating the Simulator instance if it is not already created using the provided scenario data.
           - Advancing the simulation (if not paused) by executing one simulation step.
           - Recording each ship's trail for display purposes.
@@ -104,37 +118,11 @@ class SimulationState:
         Parameters:
             dt (float): Elapsed time in seconds since the last update.
         """
-        current_w, current_h = self.screen.get_size()
-        base_w, base_h = self.base_resolution
-        self.scale = min(current_w / base_w, current_h / base_h)
-        self.sim_area_w = int(base_w * self.scale)
-        self.sim_area_h = int(base_h * self.scale)
-        self.offset_sim_x = (current_w - self.sim_area_w) // 2
-        self.offset_sim_y = (current_h - self.sim_area_h) // 2
-
-        # Calculate scaled margins and UI panel parameters.
-        self.left_margin = int(LEFT_MARGIN * self.scale)
-        self.top_margin = int(TOP_MARGIN * self.scale)
-        self.map_width = int(800 * self.scale)
-        self.map_height = int(800 * self.scale)
-        self.bottom_margin = int(BOTTOM_MARGIN * self.scale)
-        self.ui_panel_height = int(UI_PANEL_HEIGHT * self.scale)
-        self.ui_panel_y = self.offset_sim_y + self.top_margin + self.map_height + self.bottom_margin
+        # Recompute the scaled layout only when the window size changes.
+        current_size = self.screen.get_size()
+        if current_size != self._layout_size:
+            self._update_layout(*current_size)
 
-        # Define positions for UI buttons on the simulation panel.
-        self.btn_back_sim = pygame.Rect(self.offset_sim_x + self.left_margin + int(10 * self.scale),
-                                          self.ui_panel_y + int(5 * self.scale),
-                                          int(100 * self.scale), int(35 * self.scale))
-        self.btn_replay_sim = pygame.Rect(self.offset_sim_x + self.left_margin + int(120 * self.scale),
-                                          self.ui_panel_y + int(5 * self.scale),
-                                          int(100 * self.scale), int(35 * self.scale))
-        self.btn_compare = pygame.Rect(self.offset_sim_x + self.left_margin + int(230 * self.scale),
-                                       self.ui_panel_y + int(5 * self.scale),
-                                       int(100 * self.scale), int(35 * self.scale))
-        self.btn_next = pygame.Rect(self.offset_sim_x + self.left_margin + int(340 * self.scale),
-                                    self.ui_panel_y + int(5 * self.scale),
-                                    int(100 * self.scale), int(35 * self.scale))
-    
         # Create the Simulator instance if it does not exist.
         if self.sim is None:
             ships = []
@@ -161,17 +149,20 @@ class SimulationState:
                 ship = Ship(sname, sx, sy, heading, speed, dx_, dy_, length_, width_)
                 # Assign a color to the ship based on its index.
                 ship.color = ship_colors[i % len(ship_colors)]
-                ship.trail = []  # Initialize an empty trail for the ship.
+                ship.trail = Trail(MAX_TRAIL)  # Initialize an empty, bounded trail for the ship.
                 ship.source_x = sx  # Store the source x-coordinate.
                 ship.source_y = sy  # Store the source y-coordinate.
                 ships.append(ship)
+            self._trail_steps = 0
             from simulator import Simulator
+            safe_distance = self.scenario_data.get("safe_distance", 0.2)
             self.sim = Simulator(
                 ships=ships,
                 time_step=self.scenario_data.get("time_step", 30),
-                safe_distance=self.scenario_data.get("safe_distance", 0.2),
+                safe_distance=safe_distance,
                 heading_search_range=self.scenario_data.get("heading_range", 40),
-                heading_search_step=self.scenario_data.get("heading_step", 1)
+                heading_search_step=self.scenario_data.get("heading_step", 1),
+                sufficient_cpa=None if SUFFICIENT_CPA_FACTOR is None else SUFFICIENT_CPA_FACTOR * safe_distance
             )
             # Ensure that "map_size" is set in the scenario data.
             self.scenario_data.setdefault("map_size", 6.0)
@@ -184,7 +175,8 @@ class SimulationState:
             self.sim.step(debug=False)
             # Append the current position of each ship to its trail.
             for sh in self.sim.ships:
-                sh.trail.append((sh.x, sh.y))
+                sh.trail.append(sh.x, sh.y)
+            self._trail_steps += 1
             # Check if all ships have reached their destination.
             if self.sim.all_ships_arrived():
                 self.scenario_finished = True
@@ -197,71 +189,41 @@ class SimulationState:
         Parameters:
             screen (pygame.Surface): The display surface.
         """
-        screen.fill(BG_COLOR)
-        # Define the simulation area rectangle.
-        simulation_area_rect = pygame.Rect(self.offset_sim_x, self.offset_sim_y, self.sim_area_w, self.sim_area_h)
-        pygame.draw.rect(screen, BG_COLOR, simulation_area_rect)
-        # Define the map rectangle within the simulation area.
-        map_rect = pygame.Rect(self.offset_sim_x + self.left_margin,
-                               self.offset_sim_y + self.top_margin,
-                               self.map_width, self.map_height)
-        # Create a scaled font for simulation display.
-        sim_font = pygame.font.SysFont(None, int(28 * self.scale))
+        # Get the scaled font and static labels for simulation display (rebuilt only on rescale).
+        self._ensure_static_surfaces()
+        sim_font = self.sim_font
         # Calculate the conversion factor from Nautical Miles to pixels.
         nm_to_px = self.map_width / self.scenario_data.get("map_size", 6.0)
-        from draw_utils import draw_grid, draw_ship_trail, draw_safety_circle, draw_ship_rect, draw_star
-        # Draw the grid over the map.
-        draw_grid(screen, map_rect, self.scenario_data.get("map_size", 6.0), nm_to_px, tick_step=0.5)
-        # Draw each ship's trail, safety circle, and ship rectangle.
+        # Blit the static background (grid, axis labels, destination stars, UI panel) with the ship trails.
+        self._ensure_background(screen, nm_to_px)
+        self._update_trail_layer(nm_to_px)
+        screen.blit(self._trail_layer, (0, 0))
+        from draw_utils import draw_safety_circle, draw_ship_rect
+        # Draw each ship's safety circle and ship rectangle.
         for s in self.sim.ships:
-            draw_ship_trail(screen, s, nm_to_px, self.map_height,
-                            offset_x=self.offset_sim_x + self.left_margin,
-                            offset_y=self.offset_sim_y + self.top_margin)
             draw_safety_circle(screen, s, self.sim.safe_distance, nm_to_px, self.map_height,
                                offset_x=self.offset_sim_x + self.left_margin,
                                offset_y=self.offset_sim_y + self.top_margin)
             draw_ship_rect(screen, s, nm_to_px, self.map_height,
                            offset_x=self.offset_sim_x + self.left_margin,
                            offset_y=self.offset_sim_y + self.top_margin)
-        # Draw destination markers (stars) for each ship.
-        for s in self.sim.ships:
-            dest_x_screen = self.offset_sim_x + self.left_margin + int(s.dest_x * nm_to_px)
-            dest_y_screen = self.offset_sim_y + self.top_margin + self.map_height - int(s.dest_y * nm_to_px)
-            draw_star(screen, (dest_x_screen, dest_y_screen), int(8 * self.scale), s.color)
+        # Restore the axis margins and UI panel over anything drawn past the map edges.
+        for rect in self._bg_overlay_rects:
+            screen.blit(self._bg, rect, rect)
         
         # Display the current simulation time.
         time_label = sim_font.render(f"Current Time Step: {self.sim.current_time}s", True, (0, 0, 0))
-        screen.blit(time_label, (self.offset_sim_x + self.left_margin + int(10 * self.scale),
-                                 self.offset_sim_y + self.top_margin + int(10 * self.scale)))
+        screen.blit(time_label, self.time_label_pos)
         # Display instruction to pause/resume the simulation.
-        space_label = sim_font.render("Press SPACE to Pause/Resume", True, (200, 0, 0))
-        screen.blit(space_label, (self.offset_sim_x + self.left_margin + int(10 * self.scale),
-                                  self.offset_sim_y + self.top_margin + int(30 * self.scale)))
+        space_label = self._static_surfs["space"]
+        screen.blit(space_label, self.space_label_pos)
         # If the simulation is paused, display a pause message.
         if self.paused:
-            pause_text = sim_font.render("PAUSED", True, (255, 0, 0))
-            screen.blit(pause_text, (self.offset_sim_x + self.left_margin + int(10 * self.scale),
-                                     self.offset_sim_y + self.top_margin + int(50 * self.scale)))
-        from draw_utils import draw_y_axis_labels_in_margin, draw_x_axis_labels_in_margin
-        # Draw y-axis labels in the margin.
-        draw_y_axis_labels_in_margin(screen,
-            pygame.Rect(self.offset_sim_x, self.offset_sim_y + self.top_margin, self.left_margin, self.map_height),
-            self.scenario_data.get("map_size", 6.0), sim_font, tick_step=0.5)
-        # Draw x-axis labels in the margin.
-        draw_x_axis_labels_in_margin(screen,
-            pygame.Rect(self.offset_sim_x + self.left_margin, self.offset_sim_y + self.top_margin + self.map_height, self.map_width, BOTTOM_MARGIN),
-            self.scenario_data.get("map_size", 6.0), sim_font, tick_step=0.5)
-        # Draw a horizontal line separating the map from the UI panel.
-        pygame.draw.line(screen, (200, 200, 200),
-                         (self.offset_sim_x + self.left_margin, self.offset_sim_y + self.top_margin + self.map_height),
-                         (self.offset_sim_x + self.left_margin + self.map_width, self.offset_sim_y + self.top_margin + self.map_height),
-                         1)
-        # Draw the UI panel.
-        ui_panel_rect = pygame.Rect(self.offset_sim_x + self.left_margin, self.ui_panel_y, self.map_width, self.ui_panel_height)
-        pygame.draw.rect(screen, (60, 60, 60), ui_panel_rect)
+            pause_text = self._static_surfs["paused"]
+            screen.blit(pause_text, self.pause_label_pos)
         # Draw UI panel buttons.
-        draw_button(screen, self.btn_back_sim, "Back", sim_font)
-        draw_button(screen, self.btn_replay_sim, "Replay", sim_font)
+        draw_button(screen, self.btn_back_sim, "Back", sim_font, label=self._static_surfs["back"])
+        draw_button(screen, self.btn_replay_sim, "Replay", sim_font, label=self._static_surfs["replay"])
         if self.scenario_finished:
             # If compare mode is enabled, draw dashed lines representing original ship paths.
             if self.compare_mode:
@@ -271,17 +233,171 @@ class SimulationState:
                                  self.offset_sim_y + self.top_margin + self.map_height - int(s.source_y * nm_to_px))
                     end_pos = (self.offset_sim_x + self.left_margin + int(s.dest_x * nm_to_px),
                                self.offset_sim_y + self.top_margin + self.map_height - int(s.dest_y * nm_to_px))
-                    draw_dashed_line(screen, s.color, start_pos, end_pos, dash_length=int(5*self.scale), space_length=int(10*self.scale))
+                    draw_dashed_line(screen, s.color, start_pos, end_pos, dash_length=self.dash_length, space_length=self.dash_space)
             else:
                 # If compare mode is not enabled, display a finish message.
-                finish_text = sim_font.render("Scenario finished - all ships reached destinations!", True, (0, 150, 0))
+                finish_text = self._static_surfs["finished"]
                 fx = self.offset_sim_x + self.left_margin + (self.map_width - finish_text.get_width()) // 2
                 fy = self.offset_sim_y + self.top_margin + self.map_height // 2 - finish_text.get_height() // 2
                 screen.blit(finish_text, (fx, fy))
             # Draw the "Compare" and "Next" buttons in the UI panel.
-            draw_button(screen, self.btn_compare, "Compare", sim_font)
-            draw_button(screen, self.btn_next, "Next", sim_font)
+            draw_button(screen, self.btn_compare, "Compare", sim_font, label=self._static_surfs["compare"])
+            draw_button(screen, self.btn_next, "Next", sim_font, label=self._static_surfs["next"])
     
+    def _update_layout(self, current_w, current_h):
+        """
+        Calculates the scale factor for the given window size and every scaled layout value derived
+        from it: the simulation area, margins, UI panel, button rectangles, and label positions.
+
+        Called from update only when the window size changes, so the per-frame code only reads
+        the precomputed values.
+
+        Parameters:
+            current_w, current_h (int): The current window size in pixels.
+        """
+        self._layout_size = (current_w, current_h)
+        base_w, base_h = self.base_resolution
+        self.scale = min(current_w / base_w, current_h / base_h)
+        self.sim_area_w = int(base_w * self.scale)
+        self.sim_area_h = int(base_h * self.scale)
+        self.offset_sim_x = (current_w - self.sim_area_w) // 2
+        self.offset_sim_y = (current_h - self.sim_area_h) // 2
+
+        # Calculate scaled margins and UI panel parameters.
+        self.left_margin = int(LEFT_MARGIN * self.scale)
+        self.top_margin = int(TOP_MARGIN * self.scale)
+        self.map_width = int(800 * self.scale)
+        self.map_height = int(800 * self.scale)
+        self.bottom_margin = int(BOTTOM_MARGIN * self.scale)
+        self.ui_panel_height = int(UI_PANEL_HEIGHT * self.scale)
+        self.ui_panel_y = self.offset_sim_y + self.top_margin + self.map_height + self.bottom_margin
+
+        # Define positions for UI buttons on the simulation panel.
+        self.btn_back_sim = pygame.Rect(self.offset_sim_x + self.left_margin + int(10 * self.scale),
+                                          self.ui_panel_y + int(5 * self.scale),
+                                          int(100 * self.scale), int(35 * self.scale))
+        self.btn_replay_sim = pygame.Rect(self.offset_sim_x + self.left_margin + int(120 * self.scale),
+                                          self.ui_panel_y + int(5 * self.scale),
+                                          int(100 * self.scale), int(35 * self.scale))
+        self.btn_compare = pygame.Rect(self.offset_sim_x + self.left_margin + int(230 * self.scale),
+                                       self.ui_panel_y + int(5 * self.scale),
+                                       int(100 * self.scale), int(35 * self.scale))
+        self.btn_next = pygame.Rect(self.offset_sim_x + self.left_margin + int(340 * self.scale),
+                                    self.ui_panel_y + int(5 * self.scale),
+                                    int(100 * self.scale), int(35 * self.scale))
+
+        # Positions of the on-map labels and the compare-mode dash pattern.
+        label_x = self.offset_sim_x + self.left_margin + int(10 * self.scale)
+        label_y = self.offset_sim_y + self.top_margin
+        self.time_label_pos = (label_x, label_y + int(10 * self.scale))
+        self.space_label_pos = (label_x, label_y + int(30 * self.scale))
+        self.pause_label_pos = (label_x, label_y + int(50 * self.scale))
+        self.star_radius = int(8 * self.scale)
+        self.dash_length = int(5 * self.scale)
+        self.dash_space = int(10 * self.scale)
+
+    def _ensure_static_surfaces(self):
+        """
+        Builds the scaled simulation font and the pre-rendered static labels (button captions and
+        instructions), and resets the axis tick label cache.
+
+        The surfaces are only rebuilt when the scaled font size changes (e.g., after a window resize),
+        so the per-frame rendering does not rasterize the same text again.
+        """
+        font_size = int(28 * self.scale)
+        if font_size == self.sim_font_size:
+            return
+        self.sim_font_size = font_size
+        self.sim_font = load_font(None, font_size)
+        white = (255, 255, 255)
+        self._static_surfs = {
+            "back": self.sim_font.render("Back", True, white),
+            "replay": self.sim_font.render("Replay", True, white),
+            "compare": self.sim_font.render("Compare", True, white),
+            "next": self.sim_font.render("Next", True, white),
+            "space": self.sim_font.render("Press SPACE to Pause/Resume", True, (200, 0, 0)),
+            "paused": self.sim_font.render("PAUSED", True, (255, 0, 0)),
+            "finished": self.sim_font.render("Scenario finished - all ships reached destinations!", True, (0, 150, 0)),
+        }
+        self._tick_label_surfs = {}
+        self._bg = None
+
+    def _ensure_background(self, screen, nm_to_px):
+        """
+        Pre-renders the parts of the simulation screen that do not change between frames into
+        self._bg: the background fill, map grid, destination stars, axis labels, map separator line,
+        and UI panel.
+
+        The background is only rebuilt when the window size changes or a new simulation is created.
+        self._bg_overlay_rects lists the areas (axis margins and UI panel) that must be re-blitted from
+        the background after the ships are drawn, so ships never cover them.
+
+        Parameters:
+            screen (pygame.Surface): The display surface (its size and pixel format are used).
+            nm_to_px (float): Conversion factor from Nautical Miles to pixels.
+        """
+        bg_key = (screen.get_size(), self.sim)
+        if self._bg is not None and self._bg_key == bg_key:
+            return
+        self._bg_key = bg_key
+        self._bg = pygame.Surface(screen.get_size(), 0, screen)
+        bg = self._bg
+        map_size = self.scenario_data.get("map_size", 6.0)
+        bg.fill(BG_COLOR)
+        # Define the map rectangle within the simulation area.
+        map_rect = pygame.Rect(self.offset_sim_x + self.left_margin,
+                               self.offset_sim_y + self.top_margin,
+                               self.map_width, self.map_height)
+        # Draw the grid over the map.
+        draw_grid(bg, map_rect, map_size, nm_to_px, tick_step=0.5)
+        # Draw destination markers (stars) for each ship.
+        for s in self.sim.ships:
+            dest_x_screen = self.offset_sim_x + self.left_margin + int(s.dest_x * nm_to_px)
+            dest_y_screen = self.offset_sim_y + self.top_margin + self.map_height - int(s.dest_y * nm_to_px)
+            draw_star(bg, (dest_x_screen, dest_y_screen), self.star_radius, s.color)
+        # Draw y-axis labels in the margin.
+        y_margin_rect = pygame.Rect(self.offset_sim_x, self.offset_sim_y + self.top_margin, self.left_margin, self.map_height)
+        draw_y_axis_labels_in_margin(bg, y_margin_rect, map_size, self.sim_font, tick_step=0.5,
+                                     label_cache=self._tick_label_surfs)
+        # Draw x-axis labels in the margin.
+        x_margin_rect = pygame.Rect(self.offset_sim_x + self.left_margin, self.offset_sim_y + self.top_margin + self.map_height, self.map_width, BOTTOM_MARGIN)
+        draw_x_axis_labels_in_margin(bg, x_margin_rect, map_size, self.sim_font, tick_step=0.5,
+                                     label_cache=self._tick_label_surfs)
+        # Draw a horizontal line separating the map from the UI panel.
+        pygame.draw.line(bg, (200, 200, 200),
+                         (self.offset_sim_x + self.left_margin, self.offset_sim_y + self.top_margin + self.map_height),
+                         (self.offset_sim_x + self.left_margin + self.map_width, self.offset_sim_y + self.top_margin + self.map_height),
+                         1)
+        # Draw the UI panel.
+        ui_panel_rect = pygame.Rect(self.offset_sim_x + self.left_margin, self.ui_panel_y, self.map_width, self.ui_panel_height)
+        pygame.draw.rect(bg, (60, 60, 60), ui_panel_rect)
+        self._bg_overlay_rects = [y_margin_rect, x_margin_rect, ui_panel_rect]
+        self._trail_layer = None
+
+    def _update_trail_layer(self, nm_to_px):
+        """
+        Brings self._trail_layer (the static background with the ship trails drawn in) up to date.
+
+        Only the trail segments added since the previous frame are drawn, so the cost per frame does not
+        grow with the trail length. The layer is rebuilt from the full trails whenever the background is.
+
+        Parameters:
+            nm_to_px (float): Conversion factor from Nautical Miles to pixels.
+        """
+        if self._trail_layer is None:
+            self._trail_layer = self._bg.copy()
+            new_points = None
+        elif self._trail_steps > self._trail_layer_steps:
+            new_points = self._trail_steps - self._trail_layer_steps
+        else:
+            return
+        for s in self.sim.ships:
+            draw_ship_trail(self._trail_layer, s, nm_to_px, self.map_height,
+                            offset_x=self.offset_sim_x + self.left_margin,
+                            offset_y=self.offset_sim_y + self.top_margin,
+                            new_points=new_points)
+        self._trail_layer_steps = self._trail_steps
+
     def get_next_state(self):
         """
         Retrieves the next state for the application and resets the next_state variable.
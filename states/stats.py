@@ -17,6 +17,7 @@ Users can navigate back to the simulation screen or return to the main menu.
 """
 
 import pygame
+from assets import load_font
 from config import BASE_RESOLUTIONS, BG_COLOR
 from draw_utils import draw_button
 import math
@@ -107,11 +108,15 @@ class StatsState:
         self.sim_state = sim_state  # Preserves the finished simulation run
         self.sim = sim_state.sim    # Simulator instance containing simulation data and counters
         self.scenario_data = scenario_data
-        self.font = pygame.font.SysFont(None, 28)
+        self.font = load_font(None, 28)
+        # Pre-rendered button captions (the font does not change with the window scale).
+        self._button_labels = {key: self.font.render(text, True, (255, 255, 255))
+                               for key, text in (("back", "Back"), ("main_menu", "Main Menu"))}
         self.base_resolution = BASE_RESOLUTIONS["stats"]
         self.next_state = None
         self.scroll_offset = 0  # Vertical scroll offset (in pixels) for content rendering
         self.line_height = self.font.get_height() + 5  # Height for each line of text
+        self._layout_size = None  # Window size the navigation buttons were positioned for
 
     def handle_events(self, events):
         """
@@ -147,15 +152,19 @@ class StatsState:
         """
         Updates the stats screen state.
 
-        This method positions the navigation buttons relative to the current window dimensions.
-        The Back button is anchored at the bottom left and the Main Menu button at the bottom right.
+        When the window size changes, this method positions the navigation buttons relative to the
+        current window dimensions. The Back button is anchored at the bottom left and the Main Menu button at the bottom right.
 
         Parameters:
             dt (float): Elapsed time in seconds since the last update (unused in this state).
         """
-        current_w, current_h = self.screen.get_size()
-        self.btn_back_stats = pygame.Rect(50, current_h - 60, 120, 40)
-        self.btn_main_menu = pygame.Rect(current_w - 170, current_h - 60, 120, 40)
+        # Reposition the buttons only when the window size changes.
+        current_size = self.screen.get_size()
+        if current_size != self._layout_size:
+            self._layout_size = current_size
+            current_w, current_h = current_size
+            self.btn_back_stats = pygame.Rect(50, current_h - 60, 120, 40)
+            self.btn_main_menu = pygame.Rect(current_w - 170, current_h - 60, 120, 40)
     
     def render(self, screen):
         """
@@ -248,8 +257,8 @@ class StatsState:
         draw_time_comparison_chart(screen, chart_x, chart_y, chart_width, chart_height, ship_chart_data, timestep, self.font)
         
         # Draw navigation buttons anchored at the bottom.
-        draw_button(screen, self.btn_back_stats, "Back", self.font)
-        draw_button(screen, self.btn_main_menu, "Main Menu", self.font)
+        draw_button(screen, self.btn_back_stats, "Back", self.font, label=self._button_labels["back"])
+        draw_button(screen, self.btn_main_menu, "Main Menu", self.font, label=self._button_labels["main_menu"])
     
     def get_next_state(self):
         """
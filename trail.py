@@ -0,0 +1,66 @@
+# trail.py
+"""
+Ship Trail Module
+
+This module defines the Trail class, a fixed-capacity ring buffer of (x, y) positions used to record
+the path a ship has travelled for display. Points are stored in a preallocated float32 NumPy array,
+so a trail's memory is bounded and its points can be transformed to screen coordinates in one
+vectorized operation. Once the buffer is full, each new point overwrites the oldest one.
+"""
+
+import numpy as np
+
+class Trail:
+    def __init__(self, capacity):
+        """
+        Initializes an empty trail.
+
+        Parameters:
+            capacity (int): The maximum number of points kept (oldest points are dropped first).
+        """
+        self.capacity = capacity
+        self._buf = np.empty((capacity, 2), dtype=np.float32)
+        self._head = 0   # Index where the next point will be written.
+        self._len = 0    # Number of valid points in the buffer.
+
+    def __len__(self):
+        return self._len
+
+    def append(self, x, y):
+        """
+        Appends a point to the trail, overwriting the oldest point if the trail is full.
+
+        Parameters:
+            x, y (float): The position in Nautical Miles (NM).
+        """
+        self._buf[self._head, 0] = x
+        self._buf[self._head, 1] = y
+        self._head = (self._head + 1) % self.capacity
+        if self._len < self.capacity:
+            self._len += 1
+
+    def tail(self, count):
+        """
+        Returns the newest points of the trail, oldest first.
+
+        Parameters:
+            count (int): The maximum number of points to return.
+
+        Returns:
+            numpy.ndarray: Array of shape (min(count, len(self)), 2) with the points' (x, y) coordinates.
+        """
+        count = min(count, self._len)
+        start = self._head - count
+        if start >= 0:
+            return self._buf[start:self._head]
+        # The requested points wrap around the end of the buffer.
+        return np.concatenate((self._buf[start:], self._buf[:self._head]))
+
+    def points(self):
+        """
+        Returns all points of the trail, oldest first.
+
+        Returns:
+            numpy.ndarray: Array of shape (len(self), 2) with the points' (x, y) coordinates.
+        """
+        return self.tail(self._len)
@@ -10,6 +10,9 @@ drawing, and simple value retrieval (as string, float, or int).
 import pygame
 
 class TextBox:
+    # Event types handle_event reacts to; owners can skip forwarding any other event.
+    HANDLED_EVENTS = frozenset((pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
+
     def __init__(self, rect, font, initial_text=""):
         """
         Initializes a new TextBox.